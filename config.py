@@ -8,6 +8,11 @@ class Config:
     
     # Database Configuration - Use same database as calling system
     POSTGRES_URL = os.getenv("POSTGRES_URL")
+    # Connection pool per process (models/engine.py) - shared by every repository module
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "5"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -16,6 +21,8 @@ class Config:
     # OTP Configuration
     OTP_EXPIRATION_MINUTES = 10
     OTP_LENGTH = 6
+    # Dedicated server-side key for hashing stored OTPs (models/otp.py); required at startup
+    OTP_HMAC_KEY = os.getenv("OTP_HMAC_KEY")
     
     # SMS Configuration (Twilio)
     TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
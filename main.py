@@ -1,6 +1,7 @@
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import os
+from config import Config
 from middleware.subdomain_middleware import init_subdomain_middleware
 
 from routes.phone_auth_routes import auth_bp
@@ -14,6 +15,10 @@ from routes.course_calling_routes import course_calling_bp
 from routes.general_calling_routes import general_calling_bp
 from routes.public_website_routes import public_website_bp
 
+# OTPs are stored only as HMACs under this key - refuse to start without it
+if not Config.OTP_HMAC_KEY:
+    raise RuntimeError("OTP_HMAC_KEY must be set")
+
 app = Flask(__name__)
 
 # Initialize subdomain middleware
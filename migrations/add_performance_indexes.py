@@ -0,0 +1,74 @@
+"""
+Migration: Add performance indexes matching the hot repository filters
+Indexes are built CONCURRENTLY so live tables stay writable during the build
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+# (index name, statement) - executed in order, each statement is idempotent
+INDEXES = [
+    # Student/course list, update and delete paths filter on (practitioner_id, is_active)
+    ("ix_courses_practitioner_active", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_courses_practitioner_active
+        ON courses (practitioner_id, is_active)
+    """),
+    ("ix_course_promotion_leads_practitioner_active", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_course_promotion_leads_practitioner_active
+        ON course_promotion_leads (practitioner_id, is_active)
+    """),
+    # Offering listings read only active rows; the partial index skips deactivated ones
+    ("ix_offerings_practitioner_active", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_offerings_practitioner_active
+        ON offerings (practitioner_id) WHERE is_active = true
+    """),
+    # OTP verification: phone_number/is_verified equality plus an expires_at range
+    ("ix_phone_otps_phone_verified_expires", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_phone_otps_phone_verified_expires
+        ON phone_otps (phone_number, is_verified, expires_at)
+    """),
+    # Listing filter is location ILIKE '%...%'; a trigram GIN index serves leading wildcards
+    ("pg_trgm", """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm
+    """),
+    ("ix_practitioners_location_trgm", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_practitioners_location_trgm
+        ON practitioners USING gin (location gin_trgm_ops)
+    """),
+    # Practitioner listing (get_practitioners_by_filters): equality filters on is_contacted,
+    # website_published, practice_type, onboarding_step - the admin queue is "not contacted,
+    # not published". Key + INCLUDE cover PRACTITIONER_LIST_FIELDS, so summary pages can be
+    # index-only. Keep new listing filters in step with this index
+    ("ix_practitioners_list_filters", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_practitioners_list_filters
+        ON practitioners (is_contacted, website_published, practice_type, onboarding_step)
+        INCLUDE (id, name, phone_number, location)
+    """),
+]
+
+def add_performance_indexes():
+    """Create performance indexes outside a transaction block"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+
+        print("🔄 Creating performance indexes...")
+
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with db.db_session.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for name, statement in INDEXES:
+                connection.execute(text(statement))
+                print(f"✅ {name}")
+
+        print("🎉 Migration completed successfully!")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_performance_indexes()
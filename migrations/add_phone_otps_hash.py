@@ -0,0 +1,42 @@
+"""
+Migration: Store OTPs as an HMAC instead of plaintext
+Adds phone_otps.otp_hash, lets otp be NULL and clears every plaintext OTP left behind
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+def add_phone_otps_hash():
+    """Add the otp_hash column, relax otp's NOT NULL and scrub plaintext OTPs"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        print("🔄 Adding phone_otps.otp_hash...")
+        
+        with db.get_session() as session, session.begin():
+            session.execute(text("ALTER TABLE phone_otps ADD COLUMN IF NOT EXISTS otp_hash BYTEA"))
+            session.execute(text("ALTER TABLE phone_otps ALTER COLUMN otp DROP NOT NULL"))
+        
+        print("✅ phone_otps.otp_hash added, otp is now nullable")
+        
+        # Every reader matches on otp_hash, so plaintext codes are dead weight - and a leak
+        print("🔄 Clearing plaintext OTPs...")
+        
+        with db.get_session() as session, session.begin():
+            result = session.execute(text("UPDATE phone_otps SET otp = NULL WHERE otp IS NOT NULL"))
+        
+        print(f"✅ Cleared {result.rowcount} plaintext OTPs")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_phone_otps_hash()
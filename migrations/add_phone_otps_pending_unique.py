@@ -0,0 +1,53 @@
+"""
+Migration: Allow at most one pending OTP per phone number
+Adds the partial unique index OTP upserts use as their ON CONFLICT target
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+def add_phone_otps_pending_unique():
+    """Retire duplicate pending OTPs, then build the partial unique index"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        print("🔄 Retiring duplicate pending OTPs...")
+        
+        # Keep the newest pending OTP per phone; older ones are marked used, as create_otp does
+        with db.get_session() as session, session.begin():
+            result = session.execute(text("""
+                UPDATE phone_otps p
+                SET is_verified = true
+                WHERE p.is_verified = false
+                AND EXISTS (
+                    SELECT 1 FROM phone_otps newer
+                    WHERE newer.phone_number = p.phone_number
+                    AND newer.is_verified = false
+                    AND newer.id > p.id
+                )
+            """))
+            print(f"✅ Retired {result.rowcount} duplicate pending OTPs")
+        
+        print("🔄 Creating ux_phone_otps_phone_pending...")
+        
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with db.db_session.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("""
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_phone_otps_phone_pending
+                ON phone_otps (phone_number) WHERE is_verified = false
+            """))
+        print("✅ ux_phone_otps_phone_pending")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_phone_otps_pending_unique()
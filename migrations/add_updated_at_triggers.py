@@ -0,0 +1,59 @@
+"""
+Migration: Maintain updated_at with a BEFORE UPDATE trigger
+Every table with an updated_at column gets the same touch_updated_at() trigger,
+so the ORM no longer has to send updated_at on each UPDATE
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+def add_updated_at_triggers():
+    """Create touch_updated_at() and attach it to every table with an updated_at column"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        print("🔄 Adding updated_at triggers...")
+        
+        with db.get_session() as session, session.begin():
+            session.execute(text("""
+                CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+                BEGIN
+                    NEW.updated_at = now();
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            print("✅ Created touch_updated_at()")
+            
+            result = session.execute(text("""
+                SELECT table_name 
+                FROM information_schema.columns 
+                WHERE table_schema = 'public' 
+                AND column_name = 'updated_at'
+            """))
+            
+            tables = [row[0] for row in result.fetchall()]
+            
+            for table in tables:
+                trigger = f"trg_{table}_touch_updated_at"
+                session.execute(text(f'DROP TRIGGER IF EXISTS {trigger} ON "{table}"'))
+                session.execute(text(f"""
+                    CREATE TRIGGER {trigger}
+                    BEFORE UPDATE ON "{table}"
+                    FOR EACH ROW EXECUTE FUNCTION touch_updated_at()
+                """))
+                print(f"✅ {trigger}")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    add_updated_at_triggers()
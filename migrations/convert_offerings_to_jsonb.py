@@ -0,0 +1,59 @@
+"""
+Migration: Convert offerings JSON columns to JSONB
+JSONB is parsed once on write, so containment/path filters no longer re-parse text per row
+and can use the GIN index on details
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+JSONB_COLUMNS = ('basic_info', 'details', 'price_schedule')
+
+def convert_offerings_to_jsonb():
+    """Rewrite offerings JSON columns as JSONB and index details"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        print("🔄 Converting offerings JSON columns to JSONB...")
+        
+        with db.get_session() as session, session.begin():
+            result = session.execute(text("""
+                SELECT column_name 
+                FROM information_schema.columns 
+                WHERE table_name = 'offerings' 
+                AND data_type = 'json'
+            """))
+            
+            json_columns = [row[0] for row in result.fetchall() if row[0] in JSONB_COLUMNS]
+            
+            # ALTER ... TYPE rewrites the table under an exclusive lock - run off-peak
+            for column in json_columns:
+                session.execute(text(
+                    f"ALTER TABLE offerings ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+                ))
+                print(f"✅ Converted {column} to JSONB")
+            
+            if not json_columns:
+                print("✅ Offerings columns are already JSONB")
+        
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with db.db_session.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_offerings_details_gin
+                ON offerings USING gin (details jsonb_path_ops)
+            """))
+            print("✅ ix_offerings_details_gin")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    convert_offerings_to_jsonb()
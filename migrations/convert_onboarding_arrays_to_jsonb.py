@@ -0,0 +1,53 @@
+"""
+Migration: Convert onboarding text[] columns to JSONB
+These lists are always returned whole as JSON, so storing them as JSONB skips the
+text[] -> list decode on every profile read
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+# table -> text[] columns to convert
+ARRAY_COLUMNS = {
+    'facilitator_visual_profile': ('banner_urls',),
+    'facilitator_professional_details': ('languages', 'teaching_styles', 'specializations'),
+}
+
+def convert_onboarding_arrays_to_jsonb():
+    """Rewrite onboarding text[] columns as JSONB arrays"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        print("🔄 Converting onboarding array columns to JSONB...")
+        
+        with db.get_session() as session, session.begin():
+            for table, columns in ARRAY_COLUMNS.items():
+                result = session.execute(text("""
+                    SELECT column_name 
+                    FROM information_schema.columns 
+                    WHERE table_name = :table 
+                    AND data_type = 'ARRAY'
+                """), {'table': table})
+                
+                array_columns = [row[0] for row in result.fetchall() if row[0] in columns]
+                
+                # ALTER ... TYPE rewrites the table under an exclusive lock - run off-peak
+                for column in array_columns:
+                    session.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING to_jsonb({column})"
+                    ))
+                    print(f"✅ Converted {table}.{column} to JSONB")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    convert_onboarding_arrays_to_jsonb()
@@ -0,0 +1,44 @@
+"""
+Migration: Serve every phone_otps lookup from the composite OTP index
+Ensures ix_phone_otps_phone_verified_expires exists, then drops the single-column
+phone_number index it makes redundant (one less index to maintain on every OTP write)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.database import DatabaseManager
+from sqlalchemy import text
+
+def drop_redundant_phone_otps_index():
+    """Build the composite index if missing, then drop ix_phone_otps_phone_number"""
+    try:
+        # Use existing database connection
+        db = DatabaseManager()
+        
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        with db.db_session.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            print("🔄 Creating ix_phone_otps_phone_verified_expires...")
+            connection.execute(text("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_phone_otps_phone_verified_expires
+                ON phone_otps (phone_number, is_verified, expires_at)
+            """))
+            print("✅ ix_phone_otps_phone_verified_expires")
+            
+            # phone_number is the composite's leading column, so OTP verify and the
+            # pending-OTP upserts keep an index path on phone_number
+            print("🔄 Dropping ix_phone_otps_phone_number...")
+            connection.execute(text("""
+                DROP INDEX CONCURRENTLY IF EXISTS ix_phone_otps_phone_number
+            """))
+            print("✅ ix_phone_otps_phone_number dropped")
+        
+        print("🎉 Migration completed successfully!")
+        
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        raise
+
+if __name__ == "__main__":
+    drop_redundant_phone_otps_index()
@@ -0,0 +1,91 @@
+"""
+In-process caches for read-heavy repository lookups
+TTLCache entries expire after a fixed TTL and are evicted LRU-first once maxsize is reached;
+OwnershipCache lives on flask.g and is discarded at the end of each request
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, FrozenSet, Hashable, Iterable, Optional
+
+from flask import g, has_app_context
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry"""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Invalidate a key, returning its value if present"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry is not None else default
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class OwnershipCache:
+    """Request-scoped sets of resource ids owned by each facilitator
+
+    The first ownership check for a (resource, facilitator) pair loads every owned id
+    in one query; later checks in the same request are answered from memory.
+    Outside an application context nothing is cached and every check hits the loader.
+    """
+
+    def __init__(self, resource: str):
+        self.resource = resource
+
+    def _store(self) -> Optional[dict]:
+        if not has_app_context():
+            return None
+        if 'owned_ids' not in g:
+            g.owned_ids = {}
+        return g.owned_ids
+
+    def owned_ids(self, facilitator_id: int, loader: Callable[[], Iterable[int]]) -> FrozenSet[int]:
+        """Return the owned id set, populating it from loader on first use"""
+        store = self._store()
+        key = (self.resource, facilitator_id)
+        if store is not None and key in store:
+            return store[key]
+        ids = frozenset(loader())
+        if store is not None:
+            store[key] = ids
+        return ids
+
+    def invalidate(self, facilitator_id: int) -> None:
+        """Forget the cached set after a create/delete changes ownership"""
+        store = self._store()
+        if store is not None:
+            store.pop((self.resource, facilitator_id), None)
@@ -3,16 +3,20 @@ Secure Database Manager using SQLAlchemy ORM
 Replaces raw SQL with secure, injection-proof operations
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, Float, ARRAY, JSON, ForeignKey, text, func, case
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, LargeBinary, ARRAY, JSON, ForeignKey, Index, text, func, case
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.orm import sessionmaker, relationship, Session, raiseload, joinedload, selectinload
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.sql import func
-from sqlalchemy import and_, or_, desc, asc
-from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import and_, or_, desc, asc, insert, update, delete, select, inspect, bindparam, lambda_stmt
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from datetime import datetime, timedelta
 import logging
 import json
 from config import Config
+from models.cache import OwnershipCache
+from models.otp import hash_otp
+from models.engine import get_engine, dispose_engines, guard_lazy_loads
 from typing import Optional, Dict, List, Any
 
 # Configure logging
@@ -67,7 +71,7 @@ class Practitioner(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     call_transcripts = relationship("CallTranscript", back_populates="practitioner", cascade="all, delete-orphan")
@@ -162,7 +166,7 @@ class FacilitatorBasicInfo(Base):
     location = Column(String(255))
     email = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="basic_info")
@@ -173,10 +177,10 @@ class FacilitatorVisualProfile(Base):
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False)
-    banner_urls = Column(ARRAY(String))
+    banner_urls = Column(JSONB)
     profile_url = Column(String(500))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="visual_profile")
@@ -187,11 +191,11 @@ class FacilitatorProfessionalDetails(Base):
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False)
-    languages = Column(ARRAY(String))
-    teaching_styles = Column(ARRAY(String))
-    specializations = Column(ARRAY(String))
+    languages = Column(JSONB)
+    teaching_styles = Column(JSONB)
+    specializations = Column(JSONB)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="professional_details")
@@ -205,7 +209,7 @@ class FacilitatorBioAbout(Base):
     short_bio = Column(Text)
     detailed_intro = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="bio_about")
@@ -221,7 +225,7 @@ class FacilitatorWorkExperience(Base):
     duration = Column(String(100))
     description = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="work_experience")
@@ -237,7 +241,7 @@ class FacilitatorCertification(Base):
     date_received = Column(DateTime)
     credential_id = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="certifications")
@@ -249,10 +253,19 @@ class FacilitatorCertification(Base):
 class PhoneOTP(Base):
     """Manage OTP-based phone authentication"""
     __tablename__ = 'phone_otps'
+    __table_args__ = (
+        # Equality columns first, then the expiry range
+        Index('ix_phone_otps_phone_verified_expires', 'phone_number', 'is_verified', 'expires_at'),
+        # At most one pending OTP per phone - the conflict target for OTP upserts
+        Index('ux_phone_otps_phone_pending', 'phone_number', unique=True,
+              postgresql_where=text('is_verified = false')),
+    )
     
     id = Column(Integer, primary_key=True)
-    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False, index=True)
-    otp = Column(String(10), nullable=False)
+    # No standalone index: ix_phone_otps_phone_verified_expires leads with phone_number
+    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False)
+    otp = Column(String(10))  # legacy plaintext, cleared by migrations/add_phone_otps_hash.py
+    otp_hash = Column(LargeBinary)  # HMAC-SHA256 of the OTP (models/otp.py)
     otp_type = Column(String(50), default='verification')
     expires_at = Column(DateTime, nullable=False)
     is_verified = Column(Boolean, default=False)
@@ -268,18 +281,25 @@ class PhoneOTP(Base):
 class Offering(Base):
     """Store courses/services offered by practitioners"""
     __tablename__ = 'offerings'
+    __table_args__ = (
+        # Partial: facilitator listings only ever read active offerings
+        Index('ix_offerings_practitioner_active', 'practitioner_id', postgresql_where=text('is_active = true')),
+        # Containment/path filters on details (details @> '{"level": "beginner"}')
+        Index('ix_offerings_details_gin', 'details', postgresql_using='gin',
+              postgresql_ops={'details': 'jsonb_path_ops'}),
+    )
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     category = Column(String(100))
-    basic_info = Column(JSON)
-    details = Column(JSON)
-    price_schedule = Column(JSON)
+    basic_info = Column(JSONB)
+    details = Column(JSONB)
+    price_schedule = Column(JSONB)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="offerings")
@@ -287,6 +307,9 @@ class Offering(Base):
 class Course(Base):
     """Specific courses for promotional calling campaigns"""
     __tablename__ = 'courses'
+    __table_args__ = (
+        Index('ix_courses_practitioner_active', 'practitioner_id', 'is_active'),
+    )
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
@@ -296,7 +319,7 @@ class Course(Base):
     description = Column(Text, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="courses")
@@ -325,7 +348,7 @@ class CoursePromotionCall(Base):
     follow_up_required = Column(Boolean, default=False)
     notes = Column(Text)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner")
@@ -334,6 +357,9 @@ class CoursePromotionCall(Base):
 class CoursePromotionLead(Base):
     """Store potential leads for course promotion"""
     __tablename__ = 'course_promotion_leads'
+    __table_args__ = (
+        Index('ix_course_promotion_leads_practitioner_active', 'practitioner_id', 'is_active'),
+    )
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
@@ -353,7 +379,7 @@ class CoursePromotionLead(Base):
     notes = Column(Text)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner")
@@ -366,15 +392,10 @@ class DatabaseSession:
     """Secure database session manager with connection pooling"""
     
     def __init__(self, database_url: str):
-        self.engine = create_engine(
-            database_url,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=False  # Set to True for SQL debugging
-        )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.engine = get_engine(database_url)
+        # expire_on_commit=False: attributes stay loaded after commit instead of re-SELECTing on access
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+        guard_lazy_loads(self.SessionLocal)
     
     def get_session(self) -> Session:
         """Get a database session with automatic cleanup"""
@@ -385,8 +406,8 @@ class DatabaseSession:
         Base.metadata.create_all(bind=self.engine)
     
     def close(self):
-        """Close all connections"""
-        self.engine.dispose()
+        """Release this manager - the shared pool outlives it (see dispose_engines)"""
+        pass
 
 # =============================================================================
 # SECURE DATABASE MANAGER (Replacement for old DatabaseManager)
@@ -439,32 +460,25 @@ class DatabaseManager:
         """Search practitioners by phone, name, or practice type"""
         try:
             with self.get_session() as session:
-                practitioners = session.query(Practitioner).filter(
-                    or_(
-                        Practitioner.phone_number.ilike(f'%{query}%'),
-                        Practitioner.name.ilike(f'%{query}%'),
-                        Practitioner.practice_type.ilike(f'%{query}%'),
-                        Practitioner.location.ilike(f'%{query}%')
-                    )
-                ).limit(20).all()
+                # Read-only list: project the columns, no Practitioner instances
+                rows = session.execute(
+                    select(
+                        Practitioner.id, Practitioner.name, Practitioner.phone_number,
+                        Practitioner.email, Practitioner.practice_type, Practitioner.location,
+                        Practitioner.is_contacted, Practitioner.contact_status,
+                        Practitioner.last_contacted_date, Practitioner.onboarding_step,
+                        Practitioner.website_published, Practitioner.subdomain
+                    ).where(
+                        or_(
+                            Practitioner.phone_number.ilike(f'%{query}%'),
+                            Practitioner.name.ilike(f'%{query}%'),
+                            Practitioner.practice_type.ilike(f'%{query}%'),
+                            Practitioner.location.ilike(f'%{query}%')
+                        )
+                    ).limit(20)
+                ).all()
                 
-                return [
-                    {
-                        'id': p.id,
-                        'name': p.name,
-                        'phone_number': p.phone_number,
-                        'email': p.email,
-                        'practice_type': p.practice_type,
-                        'location': p.location,
-                        'is_contacted': p.is_contacted,
-                        'contact_status': p.contact_status,
-                        'last_contacted_date': p.last_contacted_date.isoformat() if p.last_contacted_date else None,
-                        'onboarding_step': p.onboarding_step,
-                        'website_published': p.website_published,
-                        'subdomain': p.subdomain
-                    }
-                    for p in practitioners
-                ]
+                return [_row_to_dict(row) for row in rows]
         except Exception as e:
             logger.error(f"Error searching practitioners: {e}")
             return []
@@ -546,7 +560,6 @@ class DatabaseManager:
                     for key, value in practitioner_data.items():
                         if hasattr(practitioner, key) and value is not None:
                             setattr(practitioner, key, value)
-                    practitioner.updated_at = datetime.now()
                 else:
                     # Create new practitioner
                     practitioner_data['phone_number'] = phone_number
@@ -565,24 +578,25 @@ class DatabaseManager:
         """Get list of practitioners who haven't been contacted yet"""
         try:
             with self.get_session() as session:
-                practitioners = session.query(Practitioner).filter(
-                    or_(
-                        Practitioner.is_contacted == False,
-                        Practitioner.is_contacted.is_(None)
-                    )
-                ).limit(limit).all()
+                rows = session.execute(
+                    select(
+                        Practitioner.id, Practitioner.name, Practitioner.phone_number,
+                        Practitioner.email, Practitioner.practice_type, Practitioner.location,
+                        Practitioner.about_us
+                    ).where(
+                        or_(
+                            Practitioner.is_contacted == False,
+                            Practitioner.is_contacted.is_(None)
+                        )
+                    ).limit(limit)
+                ).mappings().all()
                 
                 return [
                     {
-                        'id': p.id,
-                        'name': p.name,
-                        'phone_number': p.phone_number,
-                        'email': p.email,
-                        'practice_type': p.practice_type,
-                        'location': p.location,
-                        'about_us': p.about_us[:200] + '...' if p.about_us and len(p.about_us) > 200 else p.about_us
+                        **row,
+                        'about_us': row['about_us'][:200] + '...' if row['about_us'] and len(row['about_us']) > 200 else row['about_us']
                     }
-                    for p in practitioners
+                    for row in rows
                 ]
         except Exception as e:
             logger.error(f"Error getting uncontacted practitioners: {e}")
@@ -660,7 +674,7 @@ class CourseCallingRepository:
     def log_course_promotion_call(self, practitioner_id: int, course_id: int, phone_number: str) -> Optional[int]:
         """Log course promotion call - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session() as session, session.begin():
                 call = CoursePromotionCall(
                     practitioner_id=practitioner_id,
                     course_id=course_id,
@@ -668,9 +682,9 @@ class CourseCallingRepository:
                     call_status='initiated'
                 )
                 session.add(call)
-                session.commit()
-                session.refresh(call)
-                return call.id
+                session.flush()
+            # expire_on_commit=False keeps the flushed id readable without a re-SELECT
+            return call.id
         except Exception as e:
             logger.error(f"Error logging course promotion call: {e}")
             return None
@@ -688,7 +702,6 @@ class CourseCallingRepository:
                     for key, value in additional_data.items():
                         if hasattr(call, key):
                             setattr(call, key, value)
-                    call.updated_at = func.now()
                     session.commit()
                     return True
                 return False
@@ -699,40 +712,36 @@ class CourseCallingRepository:
     def get_course_promotion_calls(self, practitioner_id: int, limit: int = 50) -> List[Dict[str, Any]]:
         """Get course promotion calls for practitioner - SECURE"""
         with self.db_manager.get_session() as session:
-            calls = session.query(CoursePromotionCall).filter(
-                CoursePromotionCall.practitioner_id == practitioner_id
-            ).order_by(CoursePromotionCall.created_at.desc()).limit(limit).all()
+            # Read-only list: Core rows straight to dicts, no CoursePromotionCall instances
+            rows = session.execute(
+                select(
+                    CoursePromotionCall.id, CoursePromotionCall.course_id,
+                    CoursePromotionCall.phone_number, CoursePromotionCall.call_status,
+                    CoursePromotionCall.call_start_time, CoursePromotionCall.call_end_time,
+                    CoursePromotionCall.call_duration, CoursePromotionCall.student_name,
+                    CoursePromotionCall.student_email, CoursePromotionCall.call_outcome,
+                    CoursePromotionCall.conversion_status, CoursePromotionCall.follow_up_required,
+                    CoursePromotionCall.notes, CoursePromotionCall.created_at
+                ).where(
+                    CoursePromotionCall.practitioner_id == practitioner_id
+                ).order_by(CoursePromotionCall.created_at.desc()).limit(limit)
+            ).all()
             
-            return [{
-                'id': call.id,
-                'course_id': call.course_id,
-                'phone_number': call.phone_number,
-                'call_status': call.call_status,
-                'call_start_time': call.call_start_time.isoformat() if call.call_start_time else None,
-                'call_end_time': call.call_end_time.isoformat() if call.call_end_time else None,
-                'call_duration': call.call_duration,
-                'student_name': call.student_name,
-                'student_email': call.student_email,
-                'call_outcome': call.call_outcome,
-                'conversion_status': call.conversion_status,
-                'follow_up_required': call.follow_up_required,
-                'notes': call.notes,
-                'created_at': call.created_at.isoformat() if call.created_at else None
-            } for call in calls]
+            return [_row_to_dict(row) for row in rows]
     
     def add_course_promotion_lead(self, practitioner_id: int, course_id: int, lead_data: Dict[str, Any]) -> Optional[int]:
         """Add new course promotion lead - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session() as session, session.begin():
                 lead = CoursePromotionLead(
                     practitioner_id=practitioner_id,
                     course_id=course_id,
                     **lead_data
                 )
                 session.add(lead)
-                session.commit()
-                session.refresh(lead)
-                return lead.id
+                session.flush()
+            _owned_students.invalidate(practitioner_id)
+            return lead.id
         except Exception as e:
             logger.error(f"Error adding course promotion lead: {e}")
             return None
@@ -740,43 +749,34 @@ class CourseCallingRepository:
     def get_course_promotion_leads(self, practitioner_id: int, course_id: int = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Get course promotion leads - SECURE"""
         with self.db_manager.get_session() as session:
-            query = session.query(CoursePromotionLead).filter(
+            stmt = select(
+                CoursePromotionLead.id, CoursePromotionLead.course_id, CoursePromotionLead.name,
+                CoursePromotionLead.phone_number, CoursePromotionLead.email,
+                CoursePromotionLead.age_group, CoursePromotionLead.experience_level,
+                CoursePromotionLead.location, CoursePromotionLead.preferred_timing,
+                CoursePromotionLead.source, CoursePromotionLead.interest_level,
+                CoursePromotionLead.contact_status, CoursePromotionLead.last_contacted,
+                CoursePromotionLead.conversion_probability, CoursePromotionLead.notes,
+                CoursePromotionLead.created_at
+            ).where(
                 CoursePromotionLead.practitioner_id == practitioner_id,
                 CoursePromotionLead.is_active == True
             )
             
             if course_id:
-                query = query.filter(CoursePromotionLead.course_id == course_id)
+                stmt = stmt.where(CoursePromotionLead.course_id == course_id)
             
-            leads = query.order_by(CoursePromotionLead.created_at.desc()).limit(limit).all()
+            rows = session.execute(
+                stmt.order_by(CoursePromotionLead.created_at.desc()).limit(limit)
+            ).all()
             
-            return [{
-                'id': lead.id,
-                'course_id': lead.course_id,
-                'name': lead.name,
-                'phone_number': lead.phone_number,
-                'email': lead.email,
-                'age_group': lead.age_group,
-                'experience_level': lead.experience_level,
-                'location': lead.location,
-                'preferred_timing': lead.preferred_timing,
-                'source': lead.source,
-                'interest_level': lead.interest_level,
-                'contact_status': lead.contact_status,
-                'last_contacted': lead.last_contacted.isoformat() if lead.last_contacted else None,
-                'conversion_probability': lead.conversion_probability,
-                'notes': lead.notes,
-                'created_at': lead.created_at.isoformat() if lead.created_at else None
-            } for lead in leads]
+            return [_row_to_dict(row) for row in rows]
 
     def verify_course_ownership(self, course_id: int, practitioner_id: int) -> bool:
         """Verify course belongs to practitioner - SECURE"""
-        with self.db_manager.get_session() as session:
-            course = session.query(Course).filter(
-                Course.id == course_id,
-                Course.practitioner_id == practitioner_id
-            ).first()
-            return course is not None
+        return course_id in _owned_courses.owned_ids(
+            practitioner_id, lambda: _load_owned_ids(self.db_manager, Course, practitioner_id)
+        )
     
     def get_call_analytics(self, course_id: int, practitioner_id: int) -> Dict[str, Any]:
         """Get call analytics for course - SECURE"""
@@ -878,6 +878,102 @@ class CourseCallingRepository:
             ).first()
             return call.practitioner_id if call else None
 
+# =============================================================================
+# QUERY HELPERS
+# =============================================================================
+
+# Mapped column names per model, computed once at import. Used as a whitelist
+# for dict-driven updates instead of hasattr() through instrumented descriptors.
+_ALLOWED = {
+    model: frozenset(column.key for column in inspect(model).columns)
+    for model in (
+        Offering, FacilitatorBasicInfo, FacilitatorVisualProfile,
+        FacilitatorProfessionalDetails, FacilitatorBioAbout,
+        Course, CoursePromotionLead, CoursePromotionCall
+    )
+}
+
+# Columns callers may never set through an update dict (identity, ownership, audit)
+_PROTECTED_COLUMNS = frozenset({'id', 'practitioner_id', 'created_at', 'updated_at'})
+_UPDATABLE = {model: columns - _PROTECTED_COLUMNS for model, columns in _ALLOWED.items()}
+
+# Response shapes for the student/course/campaign APIs. Each tuple is the single
+# definition of which columns an endpoint returns; rows are rendered by _row_to_dict.
+STUDENT_OUT_COLUMNS = (
+    CoursePromotionLead.id, CoursePromotionLead.name, CoursePromotionLead.phone_number,
+    CoursePromotionLead.email, CoursePromotionLead.age_group, CoursePromotionLead.experience_level,
+    CoursePromotionLead.location, CoursePromotionLead.preferred_timing, CoursePromotionLead.source,
+    CoursePromotionLead.interest_level, CoursePromotionLead.contact_status,
+    CoursePromotionLead.last_contacted, CoursePromotionLead.conversion_probability,
+    CoursePromotionLead.notes, CoursePromotionLead.created_at, CoursePromotionLead.updated_at
+)
+
+COURSE_OUT_COLUMNS = (
+    Course.id, Course.title, Course.timing, Course.prerequisite,
+    Course.description, Course.is_active, Course.created_at, Course.updated_at
+)
+
+CAMPAIGN_OUT_COLUMNS = (
+    CoursePromotionCall.id, CoursePromotionCall.course_id, CoursePromotionCall.phone_number,
+    CoursePromotionCall.call_status, CoursePromotionCall.call_start_time,
+    CoursePromotionCall.call_end_time, CoursePromotionCall.call_duration,
+    CoursePromotionCall.student_name, CoursePromotionCall.student_email,
+    CoursePromotionCall.call_outcome, CoursePromotionCall.conversion_status,
+    CoursePromotionCall.follow_up_required, CoursePromotionCall.notes,
+    CoursePromotionCall.created_at, CoursePromotionCall.updated_at
+)
+
+# Hot list/ownership reads as lambda statements: SQLAlchemy caches the constructed
+# statement on the lambda's code object, so repeat calls skip building and compiling it.
+# Only the 'fid' bind parameter varies between calls.
+_STUDENTS_STMT = lambda_stmt(lambda: select(*STUDENT_OUT_COLUMNS).where(
+    CoursePromotionLead.practitioner_id == bindparam('fid'),
+    CoursePromotionLead.is_active == True
+))
+_COURSES_STMT = lambda_stmt(lambda: select(*COURSE_OUT_COLUMNS).where(
+    Course.practitioner_id == bindparam('fid'),
+    Course.is_active == True
+))
+_CAMPAIGNS_STMT = lambda_stmt(lambda: select(*CAMPAIGN_OUT_COLUMNS).where(
+    CoursePromotionCall.practitioner_id == bindparam('fid')
+))
+_OWNED_IDS_STMTS = {
+    Course: lambda_stmt(lambda: select(Course.id).where(Course.practitioner_id == bindparam('fid'))),
+    CoursePromotionLead: lambda_stmt(
+        lambda: select(CoursePromotionLead.id).where(CoursePromotionLead.practitioner_id == bindparam('fid'))
+    ),
+}
+
+# Request-scoped owned-id sets so repeated verify_*_ownership calls share one query
+_owned_courses = OwnershipCache('courses')
+_owned_students = OwnershipCache('students')
+
+def _row_to_dict(row) -> Dict[str, Any]:
+    """Convert a Core result row to a dict, rendering datetimes as ISO strings"""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row._mapping.items()
+    }
+
+# Onboarding steps in order, with the table whose rows mark the step as done
+_ONBOARDING_STEP_MODELS = {
+    'basic_info': FacilitatorBasicInfo,
+    'visual_profile': FacilitatorVisualProfile,
+    'professional_details': FacilitatorProfessionalDetails,
+    'bio_about': FacilitatorBioAbout,
+    'work_experience': FacilitatorWorkExperience,
+    'certifications': FacilitatorCertification,
+}
+
+def _query(session: Session, model):
+    """session.query(model) with lazy loading disabled - unplanned relationship access raises instead of issuing N+1 queries"""
+    return session.query(model).options(raiseload('*'))
+
+def _load_owned_ids(db_manager, model, practitioner_id: int) -> List[int]:
+    """All ids of model rows owned by a practitioner, for OwnershipCache"""
+    with db_manager.get_session() as session:
+        return session.execute(_OWNED_IDS_STMTS[model], {'fid': practitioner_id}).scalars().all()
+
 # =============================================================================
 # FACILITATOR REPOSITORY CLASS - SECURE ORM VERSION
 # =============================================================================
@@ -890,28 +986,37 @@ class FacilitatorRepository:
     
     def get_facilitator_offerings(self, facilitator_id: int) -> List[Dict[str, Any]]:
         """Get all active offerings for a facilitator - SECURE"""
+        return list(self.iter_facilitator_offerings(facilitator_id))
+    
+    def iter_facilitator_offerings(self, facilitator_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream active offerings for a facilitator - SECURE (server-side cursor, bounded memory)"""
+        stmt = select(
+            Offering.id, Offering.title, Offering.description, Offering.category,
+            Offering.basic_info, Offering.details, Offering.price_schedule,
+            Offering.is_active, Offering.created_at, Offering.updated_at
+        ).where(
+            Offering.practitioner_id == facilitator_id,
+            Offering.is_active == True
+        )
         with self.db_manager.get_session() as session:
-            offerings = session.query(Offering).filter(
-                Offering.practitioner_id == facilitator_id,
-                Offering.is_active == True
-            ).all()
-            
-            return [{
-                'id': offering.id,
-                'title': offering.title,
-                'description': offering.description,
-                'category': offering.category,
-                'basic_info': offering.basic_info,
-                'details': offering.details,
-                'price_schedule': offering.price_schedule,
-                'is_active': offering.is_active,
-                'created_at': offering.created_at.isoformat() if offering.created_at else None,
-                'updated_at': offering.updated_at.isoformat() if offering.updated_at else None
-            } for offering in offerings]
+            result = session.execute(stmt, execution_options={'yield_per': 200})
+            for offering in result.mappings():
+                yield {
+                    'id': offering['id'],
+                    'title': offering['title'],
+                    'description': offering['description'],
+                    'category': offering['category'],
+                    'basic_info': offering['basic_info'],
+                    'details': offering['details'],
+                    'price_schedule': offering['price_schedule'],
+                    'is_active': offering['is_active'],
+                    'created_at': offering['created_at'].isoformat() if offering['created_at'] else None,
+                    'updated_at': offering['updated_at'].isoformat() if offering['updated_at'] else None
+                }
     
     def create_offering(self, facilitator_id: int, offering_data: Dict[str, Any]) -> int:
         """Create new offering - SECURE"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, session.begin():
             offering = Offering(
                 practitioner_id=facilitator_id,
                 title=offering_data.get('title'),
@@ -924,14 +1029,13 @@ class FacilitatorRepository:
             )
             
             session.add(offering)
-            session.commit()
-            session.refresh(offering)
+            session.flush()
             return offering.id
     
     def verify_offering_ownership(self, facilitator_id: int, offering_id: int) -> bool:
         """Verify offering belongs to facilitator - SECURE"""
         with self.db_manager.get_session() as session:
-            offering = session.query(Offering).filter(
+            offering = _query(session, Offering).filter(
                 Offering.id == offering_id,
                 Offering.practitioner_id == facilitator_id
             ).first()
@@ -939,82 +1043,70 @@ class FacilitatorRepository:
     
     def update_offering(self, offering_id: int, facilitator_id: int, update_data: Dict[str, Any]) -> bool:
         """Update offering - SECURE"""
-        with self.db_manager.get_session() as session:
-            offering = session.query(Offering).filter(
+        with self.db_manager.get_session() as session, session.begin():
+            offering = _query(session, Offering).filter(
                 Offering.id == offering_id,
                 Offering.practitioner_id == facilitator_id
             ).first()
             if not offering:
                 return False
             
-            for key, value in update_data.items():
-                if hasattr(offering, key):
-                    setattr(offering, key, value)
+            for key in update_data.keys() & _UPDATABLE[Offering]:
+                setattr(offering, key, update_data[key])
             
-            offering.updated_at = func.current_timestamp()
-            session.commit()
             return True
     
     def get_offering_statistics(self, facilitator_id: int) -> Dict[str, Any]:
-        """Get offering statistics - SECURE"""
+        """Get offering statistics - SECURE (single round-trip, shaped by Postgres)"""
         with self.db_manager.get_session() as session:
-            # Get category statistics
-            category_stats = session.query(
-                Offering.category,
-                func.count(Offering.id).label('count')
-            ).filter(
-                Offering.practitioner_id == facilitator_id
-            ).group_by(Offering.category).all()
-            
-            # Get overall statistics
-            overall = session.query(
-                func.count(Offering.id).label('total'),
-                func.count(case((Offering.is_active == True, 1))).label('active'),
-                func.count(case((Offering.is_active == False, 1))).label('inactive'),
-                func.count(func.distinct(Offering.category)).label('categories')
-            ).filter(Offering.practitioner_id == facilitator_id).first()
+            stats = session.execute(text("""
+                SELECT json_build_object(
+                    'overall', json_build_object(
+                        'total_offerings', count(*),
+                        'active_offerings', count(*) FILTER (WHERE is_active),
+                        'inactive_offerings', count(*) FILTER (WHERE NOT is_active),
+                        'unique_categories', count(DISTINCT category)
+                    ),
+                    'categories', COALESCE((
+                        SELECT json_agg(json_build_object('category', c.category, 'count', c.count))
+                        FROM (
+                            SELECT category, count(*) AS count
+                            FROM offerings
+                            WHERE practitioner_id = :pid AND category IS NOT NULL
+                            GROUP BY category
+                        ) c
+                    ), '[]'::json)
+                )
+                FROM offerings
+                WHERE practitioner_id = :pid
+            """), {'pid': facilitator_id}).scalar()
             
-            return {
-                'overall': {
-                    'total_offerings': overall.total or 0,
-                    'active_offerings': overall.active or 0,
-                    'inactive_offerings': overall.inactive or 0,
-                    'unique_categories': overall.categories or 0
-                },
-                'categories': [
-                    {'category': cat.category, 'count': cat.count}
-                    for cat in category_stats if cat.category
-                ]
-            }
+            return stats
     
     def deactivate_offering(self, offering_id: int) -> bool:
         """Deactivate offering (soft delete) - SECURE"""
-        with self.db_manager.get_session() as session:
-            offering = session.query(Offering).filter(Offering.id == offering_id).first()
+        with self.db_manager.get_session() as session, session.begin():
+            offering = _query(session, Offering).filter(Offering.id == offering_id).first()
             if not offering:
                 return False
             
             offering.is_active = False
-            offering.updated_at = func.current_timestamp()
-            session.commit()
             return True
     
     def activate_offering(self, offering_id: int) -> bool:
         """Activate offering - SECURE"""
-        with self.db_manager.get_session() as session:
-            offering = session.query(Offering).filter(Offering.id == offering_id).first()
+        with self.db_manager.get_session() as session, session.begin():
+            offering = _query(session, Offering).filter(Offering.id == offering_id).first()
             if not offering:
                 return False
             
             offering.is_active = True
-            offering.updated_at = func.current_timestamp()
-            session.commit()
             return True
     
     def get_website_status(self, facilitator_id: int) -> Optional[Dict[str, Any]]:
         """Get website publishing status - SECURE"""
         with self.db_manager.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
+            practitioner = _query(session, Practitioner).filter(
                 Practitioner.id == facilitator_id
             ).first()
             
@@ -1031,7 +1123,7 @@ class FacilitatorRepository:
     def get_practitioner_by_subdomain(self, subdomain: str) -> Optional[Dict[str, Any]]:
         """Get practitioner by subdomain - SECURE"""
         with self.db_manager.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
+            practitioner = _query(session, Practitioner).filter(
                 Practitioner.subdomain == subdomain,
                 Practitioner.website_published == True,
                 Practitioner.is_active == True
@@ -1059,13 +1151,13 @@ class FacilitatorRepository:
     
     def update_facilitator_website(self, website_data: Dict[str, Any]) -> bool:
         """Update facilitator website settings - SECURE"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, session.begin():
             try:
                 facilitator_id = website_data.get('facilitator_id')
                 subdomain = website_data.get('subdomain')
                 is_published = website_data.get('is_published', False)
                 
-                practitioner = session.query(Practitioner).filter(
+                practitioner = _query(session, Practitioner).filter(
                     Practitioner.id == facilitator_id
                 ).first()
                 
@@ -1077,16 +1169,14 @@ class FacilitatorRepository:
                 practitioner.website_published = is_published
                 practitioner.website_status = 'live' if is_published else 'draft'
                 practitioner.website_published_at = func.current_timestamp() if is_published else None
-                practitioner.updated_at = func.current_timestamp()
                 
-                session.commit()
                 logger.info(f"✅ Updated website settings for facilitator {facilitator_id}")
-                return True
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error updating website settings: {e}")
                 raise
+        
+        return True
     
     # =============================================================================
     # OTP AUTHENTICATION METHODS
@@ -1095,25 +1185,31 @@ class FacilitatorRepository:
         """Create new OTP for phone authentication - SECURE"""
         try:
             from datetime import datetime, timedelta
-            with self.db_manager.get_session() as session:
-                # Mark existing OTPs as used
-                session.query(PhoneOTP).filter(
-                    PhoneOTP.phone_number == phone_number,
-                    PhoneOTP.is_verified == False
-                ).update({PhoneOTP.is_verified: True})
-                # Add new OTP
-                expires_at = datetime.now() + timedelta(minutes=10)
-                new_otp = PhoneOTP(
-                    phone_number=phone_number,
-                    otp=otp,
-                    otp_type='verification',
-                    expires_at=expires_at,
-                    is_verified=False
-                )
-                session.add(new_otp)
-                session.commit()
-                session.refresh(new_otp)
-                return new_otp.id
+            # Replace the phone's pending OTP in place - at most one per phone (ux_phone_otps_phone_pending),
+            # so concurrent sends can't collide on the unique index. Expiry stays on the app clock,
+            # the one verify_otp_and_get_user_status compares against
+            stmt = pg_insert(PhoneOTP).values(
+                phone_number=phone_number,
+                otp=None,
+                otp_hash=hash_otp(otp),
+                otp_type='verification',
+                expires_at=datetime.now() + timedelta(minutes=10),
+                is_verified=False
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['phone_number'],
+                index_where=PhoneOTP.is_verified == False,
+                set_={
+                    'otp': stmt.excluded.otp,
+                    'otp_hash': stmt.excluded.otp_hash,
+                    'otp_type': stmt.excluded.otp_type,
+                    'expires_at': stmt.excluded.expires_at,
+                    'created_at': func.now()
+                }
+            ).returning(PhoneOTP.id)
+            
+            with self.db_manager.get_session() as session, session.begin():
+                return session.execute(stmt).scalar_one()
         except Exception as e:
             logger.error(f"Error creating OTP: {e}")
             return None
@@ -1122,20 +1218,21 @@ class FacilitatorRepository:
         """Verify OTP and determine if user needs onboarding - ENHANCED"""
         try:
             from datetime import datetime
-            with self.db_manager.get_session() as session:
-                otp_record = session.query(PhoneOTP).filter(
+            with self.db_manager.get_session() as session, session.begin():
+                # OTP and its practitioner (if any) in one round trip
+                row = session.query(PhoneOTP, Practitioner).outerjoin(
+                    Practitioner, Practitioner.phone_number == PhoneOTP.phone_number
+                ).options(raiseload('*')).filter(
                     PhoneOTP.phone_number == phone_number,
-                    PhoneOTP.otp == otp,
+                    PhoneOTP.otp_hash == hash_otp(otp),
                     PhoneOTP.is_verified == False,
                     PhoneOTP.expires_at > datetime.now()
                 ).first()
-                if not otp_record:
+                if not row:
                     return {"success": False, "error": "Invalid or expired OTP"}
                 
+                otp_record, practitioner = row
                 otp_record.is_verified = True
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.phone_number == phone_number
-                ).first()
                 
                 if not practitioner:
                     # Truly new user - create account
@@ -1148,8 +1245,7 @@ class FacilitatorRepository:
                         contact_status='new'
                     )
                     session.add(practitioner)
-                    session.commit()
-                    session.refresh(practitioner)
+                    session.flush()
                     
                     return {
                         "success": True,
@@ -1166,7 +1262,6 @@ class FacilitatorRepository:
                     # Update first login date if not set
                     if not practitioner.crm_first_login_date:
                         practitioner.crm_first_login_date = func.now()
-                        session.commit()
                     
                     return {
                         "success": True,
@@ -1192,8 +1287,8 @@ class FacilitatorRepository:
     def create_facilitator_account(self, phone_number: str, email: Optional[str] = None) -> Optional[int]:
         """Create new facilitator account - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
-                existing = session.query(Practitioner).filter(
+            with self.db_manager.get_session() as session, session.begin():
+                existing = _query(session, Practitioner).filter(
                     Practitioner.phone_number == phone_number
                 ).first()
                 if existing:
@@ -1206,59 +1301,57 @@ class FacilitatorRepository:
                     contact_status='new'
                 )
                 session.add(practitioner)
-                session.commit()
-                session.refresh(practitioner)
+                session.flush()
                 return practitioner.id
         except Exception as e:
             logger.error(f"Error creating facilitator account: {e}")
             return None
 
+    def _save_onboarding_section(self, session: Session, model, practitioner_id: int, data: Dict[str, Any],
+                                 step: int, **practitioner_values) -> None:
+        """Upsert a one-to-one onboarding section and advance onboarding_step in a single statement"""
+        values = {key: data[key] for key in data.keys() & _UPDATABLE[model]}
+        
+        # INSERT ... ON CONFLICT (practitioner_id) DO UPDATE, run as a writable CTE
+        upsert = pg_insert(model).values(practitioner_id=practitioner_id, **values)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[model.practitioner_id],
+            # the touch_updated_at trigger stamps updated_at; with no values, SET practitioner_id
+            # to itself so the existing row is still returned
+            set_=values or {'practitioner_id': practitioner_id}
+        ).returning(model.id).cte('upsert')
+        
+        # WITH upsert AS (...) UPDATE practitioners SET onboarding_step = GREATEST(...)
+        stmt = update(Practitioner).where(
+            Practitioner.id == practitioner_id
+        ).values(
+            onboarding_step=func.greatest(func.coalesce(Practitioner.onboarding_step, 0), step),
+            **practitioner_values
+        ).add_cte(upsert).execution_options(synchronize_session=False)
+        session.execute(stmt)
+
     def get_facilitator_onboarding_status(self, practitioner_id: int) -> Dict[str, Any]:
         """Get facilitator onboarding status and data - SECURE"""
         try:
             with self.db_manager.get_session() as session:
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
+                # Practitioner columns plus one EXISTS flag per onboarding step, in a single query
+                practitioner = session.execute(
+                    select(
+                        Practitioner.id, Practitioner.phone_number, Practitioner.email,
+                        Practitioner.name, Practitioner.onboarding_step,
+                        *(
+                            select(model.id).where(model.practitioner_id == Practitioner.id).exists().label(step)
+                            for step, model in _ONBOARDING_STEP_MODELS.items()
+                        )
+                    ).where(Practitioner.id == practitioner_id)
                 ).first()
                 
                 if not practitioner:
                     return {"error": "Practitioner not found"}
                 
-                # Get completion status for each step
-                basic_info = session.query(FacilitatorBasicInfo).filter(
-                    FacilitatorBasicInfo.practitioner_id == practitioner_id
-                ).first()
-                
-                visual_profile = session.query(FacilitatorVisualProfile).filter(
-                    FacilitatorVisualProfile.practitioner_id == practitioner_id
-                ).first()
-                
-                professional_details = session.query(FacilitatorProfessionalDetails).filter(
-                    FacilitatorProfessionalDetails.practitioner_id == practitioner_id
-                ).first()
-                
-                bio_about = session.query(FacilitatorBioAbout).filter(
-                    FacilitatorBioAbout.practitioner_id == practitioner_id
-                ).first()
-                
-                work_experience = session.query(FacilitatorWorkExperience).filter(
-                    FacilitatorWorkExperience.practitioner_id == practitioner_id
-                ).count()
-                
-                certifications = session.query(FacilitatorCertification).filter(
-                    FacilitatorCertification.practitioner_id == practitioner_id
-                ).count()
-                
                 return {
                     "current_step": practitioner.onboarding_step,
-                    "completed_steps": {
-                        "basic_info": basic_info is not None,
-                        "visual_profile": visual_profile is not None,
-                        "professional_details": professional_details is not None,
-                        "bio_about": bio_about is not None,
-                        "work_experience": work_experience > 0,
-                        "certifications": certifications > 0
-                    },
+                    "completed_steps": {step: practitioner._mapping[step] for step in _ONBOARDING_STEP_MODELS},
                     "practitioner": {
                         "id": practitioner.id,
                         "phone_number": practitioner.phone_number,
@@ -1274,42 +1367,20 @@ class FacilitatorRepository:
     def save_basic_info(self, practitioner_id: int, basic_info_data: Dict[str, Any]) -> bool:
         """Save basic info for facilitator - ENHANCED with pre-fill support"""
         try:
-            with self.db_manager.get_session() as session:
-                # Check if basic info already exists
-                existing = session.query(FacilitatorBasicInfo).filter(
-                    FacilitatorBasicInfo.practitioner_id == practitioner_id
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    for key, value in basic_info_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                    existing.updated_at = func.now()
-                else:
-                    # Create new
-                    basic_info = FacilitatorBasicInfo(
-                        practitioner_id=practitioner_id,
-                        **basic_info_data
-                    )
-                    session.add(basic_info)
-                
-                # Update practitioner name and onboarding step
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
-                ).first()
-                
-                if practitioner:
-                    # Update name if provided
-                    if 'first_name' in basic_info_data and 'last_name' in basic_info_data:
-                        practitioner.name = f"{basic_info_data['first_name']} {basic_info_data['last_name']}"
-                    if 'email' in basic_info_data:
-                        practitioner.email = basic_info_data['email']
-                    if practitioner.onboarding_step < 1:
-                        practitioner.onboarding_step = 1
-                
-                session.commit()
-                return True
+            with self.db_manager.get_session() as session, session.begin():
+                # Update practitioner name/email if provided
+                practitioner_values = {}
+                if 'first_name' in basic_info_data and 'last_name' in basic_info_data:
+                    practitioner_values['name'] = f"{basic_info_data['first_name']} {basic_info_data['last_name']}"
+                if 'email' in basic_info_data:
+                    practitioner_values['email'] = basic_info_data['email']
+                
+                # Upsert basic info and advance onboarding step in one round-trip
+                self._save_onboarding_section(
+                    session, FacilitatorBasicInfo, practitioner_id, basic_info_data, 1, **practitioner_values
+                )
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving basic info: {e}")
@@ -1319,7 +1390,7 @@ class FacilitatorRepository:
         """Get pre-filled basic info from calling system data - NEW"""
         try:
             with self.db_manager.get_session() as session:
-                practitioner = session.query(Practitioner).filter(
+                practitioner = _query(session, Practitioner).filter(
                     Practitioner.id == practitioner_id
                 ).first()
                 
@@ -1351,36 +1422,11 @@ class FacilitatorRepository:
     def save_visual_profile(self, practitioner_id: int, visual_data: Dict[str, Any]) -> bool:
         """Save visual profile for facilitator - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
-                # Check if visual profile already exists
-                existing = session.query(FacilitatorVisualProfile).filter(
-                    FacilitatorVisualProfile.practitioner_id == practitioner_id
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    for key, value in visual_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                    existing.updated_at = func.now()
-                else:
-                    # Create new
-                    visual_profile = FacilitatorVisualProfile(
-                        practitioner_id=practitioner_id,
-                        **visual_data
-                    )
-                    session.add(visual_profile)
-                
-                # Update onboarding step
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
-                ).first()
-                
-                if practitioner and practitioner.onboarding_step < 2:
-                    practitioner.onboarding_step = 2
-                
-                session.commit()
-                return True
+            with self.db_manager.get_session() as session, session.begin():
+                # Upsert and advance onboarding step in one round-trip
+                self._save_onboarding_section(session, FacilitatorVisualProfile, practitioner_id, visual_data, 2)
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving visual profile: {e}")
@@ -1389,36 +1435,11 @@ class FacilitatorRepository:
     def save_professional_details(self, practitioner_id: int, professional_data: Dict[str, Any]) -> bool:
         """Save professional details for facilitator - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
-                # Check if professional details already exist
-                existing = session.query(FacilitatorProfessionalDetails).filter(
-                    FacilitatorProfessionalDetails.practitioner_id == practitioner_id
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    for key, value in professional_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                    existing.updated_at = func.now()
-                else:
-                    # Create new
-                    professional_details = FacilitatorProfessionalDetails(
-                        practitioner_id=practitioner_id,
-                        **professional_data
-                    )
-                    session.add(professional_details)
-                
-                # Update onboarding step
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
-                ).first()
-                
-                if practitioner and practitioner.onboarding_step < 3:
-                    practitioner.onboarding_step = 3
-                
-                session.commit()
-                return True
+            with self.db_manager.get_session() as session, session.begin():
+                # Upsert and advance onboarding step in one round-trip
+                self._save_onboarding_section(session, FacilitatorProfessionalDetails, practitioner_id, professional_data, 3)
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving professional details: {e}")
@@ -1427,36 +1448,11 @@ class FacilitatorRepository:
     def save_bio_about(self, practitioner_id: int, bio_data: Dict[str, Any]) -> bool:
         """Save bio and about info for facilitator - SECURE"""
         try:
-            with self.db_manager.get_session() as session:
-                # Check if bio info already exists
-                existing = session.query(FacilitatorBioAbout).filter(
-                    FacilitatorBioAbout.practitioner_id == practitioner_id
-                ).first()
-                
-                if existing:
-                    # Update existing
-                    for key, value in bio_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                    existing.updated_at = func.now()
-                else:
-                    # Create new
-                    bio_about = FacilitatorBioAbout(
-                        practitioner_id=practitioner_id,
-                        **bio_data
-                    )
-                    session.add(bio_about)
-                
-                # Update onboarding step
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
-                ).first()
-                
-                if practitioner and practitioner.onboarding_step < 4:
-                    practitioner.onboarding_step = 4
-                
-                session.commit()
-                return True
+            with self.db_manager.get_session() as session, session.begin():
+                # Upsert and advance onboarding step in one round-trip
+                self._save_onboarding_section(session, FacilitatorBioAbout, practitioner_id, bio_data, 4)
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving bio about: {e}")
@@ -1465,7 +1461,7 @@ class FacilitatorRepository:
     def save_experience_certifications(self, practitioner_id: int, experience_data: List[Dict[str, Any]], certification_data: List[Dict[str, Any]]) -> bool:
         """Save experience and certifications - Complete onboarding - ENHANCED"""
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.get_session() as session, session.begin():
                 # Clear existing records
                 session.query(FacilitatorWorkExperience).filter(
                     FacilitatorWorkExperience.practitioner_id == practitioner_id
@@ -1498,7 +1494,7 @@ class FacilitatorRepository:
                     session.add(certification)
                 
                 # Update practitioner onboarding step and mark CRM onboarding as completed
-                practitioner = session.query(Practitioner).filter(
+                practitioner = _query(session, Practitioner).filter(
                     Practitioner.id == practitioner_id
                 ).first()
                 
@@ -1506,10 +1502,8 @@ class FacilitatorRepository:
                     practitioner.onboarding_step = 6  # Complete all steps
                     practitioner.crm_onboarding_completed = True  # NEW: Mark CRM onboarding complete
                     practitioner.crm_onboarding_completed_date = func.now()  # NEW: Set completion date
-                    practitioner.updated_at = func.now()
-                
-                session.commit()
-                return True
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving experience and certifications: {e}")
@@ -1519,39 +1513,28 @@ class FacilitatorRepository:
         """Get complete facilitator profile data - SECURE"""
         try:
             with self.db_manager.get_session() as session:
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == practitioner_id
-                ).first()
+                # One-to-one sections ride on the main SELECT; collections use one IN query each
+                practitioner = session.query(Practitioner).options(
+                    joinedload(Practitioner.basic_info),
+                    joinedload(Practitioner.visual_profile),
+                    joinedload(Practitioner.professional_details),
+                    joinedload(Practitioner.bio_about),
+                    selectinload(Practitioner.work_experience),
+                    selectinload(Practitioner.certifications),
+                    raiseload('*')
+                ).filter(Practitioner.id == practitioner_id).one_or_none()
                 
                 if not practitioner:
                     return None
                 
-                # Get all related data
-                basic_info = session.query(FacilitatorBasicInfo).filter(
-                    FacilitatorBasicInfo.practitioner_id == practitioner_id
-                ).first()
-                
-                visual_profile = session.query(FacilitatorVisualProfile).filter(
-                    FacilitatorVisualProfile.practitioner_id == practitioner_id
-                ).first()
-                
-                professional_details = session.query(FacilitatorProfessionalDetails).filter(
-                    FacilitatorProfessionalDetails.practitioner_id == practitioner_id
-                ).first()
-                
-                bio_about = session.query(FacilitatorBioAbout).filter(
-                    FacilitatorBioAbout.practitioner_id == practitioner_id
-                ).first()
+                basic_info = practitioner.basic_info
+                visual_profile = practitioner.visual_profile
+                professional_details = practitioner.professional_details
+                bio_about = practitioner.bio_about
+                work_experience = practitioner.work_experience
+                certifications = practitioner.certifications
                 
-                work_experience = session.query(FacilitatorWorkExperience).filter(
-                    FacilitatorWorkExperience.practitioner_id == practitioner_id
-                ).all()
-                
-                certifications = session.query(FacilitatorCertification).filter(
-                    FacilitatorCertification.practitioner_id == practitioner_id
-                ).all()
-                
-                return {
+                profile = {
                     "practitioner": {
                         "id": practitioner.id,
                         "phone_number": practitioner.phone_number,
@@ -1596,6 +1579,8 @@ class FacilitatorRepository:
                         "credential_id": cert.credential_id
                     } for cert in certifications]
                 }
+            
+            return profile
                 
         except Exception as e:
             logger.error(f"Error getting complete facilitator profile: {e}")
@@ -1613,100 +1598,108 @@ class StudentRepository:
     
     def get_students(self, facilitator_id: int) -> List[Dict[str, Any]]:
         """Get all students for a facilitator - SECURE"""
+        return list(self.iter_students(facilitator_id))
+    
+    def iter_students(self, facilitator_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream students for a facilitator - SECURE (server-side cursor, bounded memory)"""
+        # For now, return students from course promotion leads
         with self.db_manager.get_session() as session:
-            # For now, return students from course promotion leads
-            leads = session.query(CoursePromotionLead).filter(
-                CoursePromotionLead.practitioner_id == facilitator_id,
-                CoursePromotionLead.is_active == True
-            ).all()
-            
-            return [{
-                'id': lead.id,
-                'name': lead.name,
-                'phone_number': lead.phone_number,
-                'email': lead.email,
-                'age_group': lead.age_group,
-                'experience_level': lead.experience_level,
-                'location': lead.location,
-                'preferred_timing': lead.preferred_timing,
-                'source': lead.source,
-                'interest_level': lead.interest_level,
-                'contact_status': lead.contact_status,
-                'last_contacted': lead.last_contacted.isoformat() if lead.last_contacted else None,
-                'conversion_probability': lead.conversion_probability,
-                'notes': lead.notes,
-                'created_at': lead.created_at.isoformat() if lead.created_at else None,
-                'updated_at': lead.updated_at.isoformat() if lead.updated_at else None
-            } for lead in leads]
+            result = session.execute(
+                _STUDENTS_STMT, {'fid': facilitator_id}, execution_options={'yield_per': 500}
+            )
+            for row in result:
+                yield _row_to_dict(row)
+    
+    @staticmethod
+    def _student_values(facilitator_id: int, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values for a new student/lead row"""
+        return {
+            'practitioner_id': facilitator_id,
+            'name': student_data.get('name'),
+            'phone_number': student_data.get('phone_number'),
+            'email': student_data.get('email'),
+            'age_group': student_data.get('age_group'),
+            'experience_level': student_data.get('experience_level'),
+            'location': student_data.get('location'),
+            'preferred_timing': student_data.get('preferred_timing'),
+            'source': student_data.get('source', 'manual'),
+            'interest_level': student_data.get('interest_level', 5),
+            'contact_status': student_data.get('contact_status', 'new'),
+            'conversion_probability': student_data.get('conversion_probability', 50),
+            'notes': student_data.get('notes'),
+            'is_active': True
+        }
     
     def create_student(self, facilitator_id: int, student_data: Dict[str, Any]) -> int:
         """Create new student/lead - SECURE"""
-        with self.db_manager.get_session() as session:
-            student = CoursePromotionLead(
-                practitioner_id=facilitator_id,
-                name=student_data.get('name'),
-                phone_number=student_data.get('phone_number'),
-                email=student_data.get('email'),
-                age_group=student_data.get('age_group'),
-                experience_level=student_data.get('experience_level'),
-                location=student_data.get('location'),
-                preferred_timing=student_data.get('preferred_timing'),
-                source=student_data.get('source', 'manual'),
-                interest_level=student_data.get('interest_level', 5),
-                contact_status=student_data.get('contact_status', 'new'),
-                conversion_probability=student_data.get('conversion_probability', 50),
-                notes=student_data.get('notes'),
-                is_active=True
-            )
+        with self.db_manager.get_session() as session, session.begin():
+            student = CoursePromotionLead(**self._student_values(facilitator_id, student_data))
             
             session.add(student)
-            session.commit()
-            session.refresh(student)
-            return student.id
+            session.flush()
+        
+        _owned_students.invalidate(facilitator_id)
+        return student.id
+    
+    def bulk_create_students(self, facilitator_id: int, student_data_list: List[Dict[str, Any]]) -> List[int]:
+        """Create many students/leads with one multi-row INSERT ... RETURNING - SECURE"""
+        if not student_data_list:
+            return []
+        
+        rows = [self._student_values(facilitator_id, student_data) for student_data in student_data_list]
+        with self.db_manager.get_session() as session, session.begin():
+            result = session.execute(insert(CoursePromotionLead).returning(CoursePromotionLead.id), rows)
+            student_ids = [row.id for row in result]
+        
+        _owned_students.invalidate(facilitator_id)
+        return student_ids
+    
+    def import_students_from_csv(self, facilitator_id: int, csv_data: List[Dict[str, Any]]) -> int:
+        """Import students from parsed CSV rows - SECURE"""
+        students = []
+        for row in csv_data:
+            # Drop blank cells so column defaults apply; skip rows without a phone number
+            student = {
+                key: value.strip() for key, value in row.items()
+                if key and isinstance(value, str) and value.strip()
+            }
+            if student.get('phone_number'):
+                students.append(student)
+        
+        return len(self.bulk_create_students(facilitator_id, students))
     
     def update_student(self, student_id: int, facilitator_id: int, update_data: Dict[str, Any]) -> bool:
         """Update student - SECURE"""
-        with self.db_manager.get_session() as session:
-            student = session.query(CoursePromotionLead).filter(
-                CoursePromotionLead.id == student_id,
-                CoursePromotionLead.practitioner_id == facilitator_id
-            ).first()
-            
-            if not student:
-                return False
-            
-            for key, value in update_data.items():
-                if hasattr(student, key):
-                    setattr(student, key, value)
-            
-            student.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+        values = {key: update_data[key] for key in update_data.keys() & _UPDATABLE[CoursePromotionLead]}
+        with self.db_manager.get_session() as session, session.begin():
+            # Ownership check folded into the UPDATE's WHERE clause - one statement
+            result = session.execute(
+                update(CoursePromotionLead).where(
+                    CoursePromotionLead.id == student_id,
+                    CoursePromotionLead.practitioner_id == facilitator_id
+                ).values(values or {'id': CoursePromotionLead.id}).execution_options(synchronize_session=False)
+            )
+            return result.rowcount > 0
     
     def delete_student(self, student_id: int, facilitator_id: int) -> bool:
         """Soft delete student - SECURE"""
-        with self.db_manager.get_session() as session:
-            student = session.query(CoursePromotionLead).filter(
-                CoursePromotionLead.id == student_id,
-                CoursePromotionLead.practitioner_id == facilitator_id
+        with self.db_manager.get_session() as session, session.begin():
+            # Already-deleted rows don't match, so a repeat delete reports False without a write
+            deleted = session.execute(
+                update(CoursePromotionLead).where(
+                    CoursePromotionLead.id == student_id,
+                    CoursePromotionLead.practitioner_id == facilitator_id,
+                    CoursePromotionLead.is_active == True
+                ).values(is_active=False)
+                .returning(CoursePromotionLead.id).execution_options(synchronize_session=False)
             ).first()
-            
-            if not student:
-                return False
-            
-            student.is_active = False
-            student.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+            return deleted is not None
     
     def verify_student_ownership(self, facilitator_id: int, student_id: int) -> bool:
-        """Verify student belongs to facilitator - SECURE"""
-        with self.db_manager.get_session() as session:
-            student = session.query(CoursePromotionLead).filter(
-                CoursePromotionLead.id == student_id,
-                CoursePromotionLead.practitioner_id == facilitator_id
-            ).first()
-            return student is not None
+        """Verify student belongs to facilitator - SECURE (one id-set query per request)"""
+        return student_id in _owned_students.owned_ids(
+            facilitator_id, lambda: _load_owned_ids(self.db_manager, CoursePromotionLead, facilitator_id)
+        )
 
 # =============================================================================
 # COURSE REPOSITORY CLASS - SECURE ORM VERSION
@@ -1721,48 +1714,26 @@ class CourseRepository:
     def get_courses(self, facilitator_id: int) -> List[Dict[str, Any]]:
         """Get all courses for a facilitator - SECURE"""
         with self.db_manager.get_session() as session:
-            courses = session.query(Course).filter(
-                Course.practitioner_id == facilitator_id,
-                Course.is_active == True
-            ).all()
-            
-            return [{
-                'id': course.id,
-                'title': course.title,
-                'timing': course.timing,
-                'prerequisite': course.prerequisite,
-                'description': course.description,
-                'is_active': course.is_active,
-                'created_at': course.created_at.isoformat() if course.created_at else None,
-                'updated_at': course.updated_at.isoformat() if course.updated_at else None
-            } for course in courses]
+            rows = session.execute(_COURSES_STMT, {'fid': facilitator_id}).all()
+        
+        return [_row_to_dict(row) for row in rows]
     
     def get_course(self, course_id: int, facilitator_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific course for a facilitator - SECURE"""
         with self.db_manager.get_session() as session:
-            course = session.query(Course).filter(
-                Course.id == course_id,
-                Course.practitioner_id == facilitator_id,
-                Course.is_active == True
+            row = session.execute(
+                select(*COURSE_OUT_COLUMNS).where(
+                    Course.id == course_id,
+                    Course.practitioner_id == facilitator_id,
+                    Course.is_active == True
+                )
             ).first()
             
-            if not course:
-                return None
-            
-            return {
-                'id': course.id,
-                'title': course.title,
-                'timing': course.timing,
-                'prerequisite': course.prerequisite,
-                'description': course.description,
-                'is_active': course.is_active,
-                'created_at': course.created_at.isoformat() if course.created_at else None,
-                'updated_at': course.updated_at.isoformat() if course.updated_at else None
-            }
+            return _row_to_dict(row) if row else None
     
     def create_course(self, facilitator_id: int, course_data: Dict[str, Any]) -> int:
         """Create new course - SECURE"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, session.begin():
             course = Course(
                 practitioner_id=facilitator_id,
                 title=course_data.get('title'),
@@ -1773,53 +1744,46 @@ class CourseRepository:
             )
             
             session.add(course)
-            session.commit()
-            session.refresh(course)
-            return course.id
+            session.flush()
+            course_id = course.id
+        
+        _owned_courses.invalidate(facilitator_id)
+        return course_id
     
     def update_course(self, course_id: int, facilitator_id: int, update_data: Dict[str, Any]) -> bool:
         """Update course - SECURE"""
-        with self.db_manager.get_session() as session:
-            course = session.query(Course).filter(
-                Course.id == course_id,
-                Course.practitioner_id == facilitator_id,
-                Course.is_active == True
-            ).first()
-            if not course:
-                return False
-            
-            for key, value in update_data.items():
-                if hasattr(course, key):
-                    setattr(course, key, value)
-            
-            course.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+        values = {key: update_data[key] for key in update_data.keys() & _UPDATABLE[Course]}
+        with self.db_manager.get_session() as session, session.begin():
+            # Ownership check folded into the UPDATE's WHERE clause - one statement
+            result = session.execute(
+                update(Course).where(
+                    Course.id == course_id,
+                    Course.practitioner_id == facilitator_id,
+                    Course.is_active == True
+                ).values(values or {'id': Course.id}).execution_options(synchronize_session=False)
+            )
+        
+        return result.rowcount > 0
     
     def delete_course(self, course_id: int, facilitator_id: int) -> bool:
         """Soft delete course - SECURE"""
-        with self.db_manager.get_session() as session:
-            course = session.query(Course).filter(
-                Course.id == course_id,
-                Course.practitioner_id == facilitator_id,
-                Course.is_active == True
+        with self.db_manager.get_session() as session, session.begin():
+            deleted = session.execute(
+                update(Course).where(
+                    Course.id == course_id,
+                    Course.practitioner_id == facilitator_id,
+                    Course.is_active == True
+                ).values(is_active=False)
+                .returning(Course.id).execution_options(synchronize_session=False)
             ).first()
-            if not course:
-                return False
-            
-            course.is_active = False
-            course.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+        
+        return deleted is not None
     
     def verify_course_ownership(self, facilitator_id: int, course_id: int) -> bool:
-        """Verify course belongs to facilitator - SECURE"""
-        with self.db_manager.get_session() as session:
-            course = session.query(Course).filter(
-                Course.id == course_id,
-                Course.practitioner_id == facilitator_id
-            ).first()
-            return course is not None
+        """Verify course belongs to facilitator - SECURE (one id-set query per request)"""
+        return course_id in _owned_courses.owned_ids(
+            facilitator_id, lambda: _load_owned_ids(self.db_manager, Course, facilitator_id)
+        )
 
 # =============================================================================
 # CAMPAIGN REPOSITORY CLASS - SECURE ORM VERSION
@@ -1833,33 +1797,21 @@ class CampaignRepository:
     
     def get_campaigns(self, facilitator_id: int) -> List[Dict[str, Any]]:
         """Get all campaigns for a facilitator - SECURE"""
+        return list(self.iter_campaigns(facilitator_id))
+    
+    def iter_campaigns(self, facilitator_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream campaigns for a facilitator - SECURE (server-side cursor, bounded memory)"""
+        # For now, return course promotion calls as campaigns
         with self.db_manager.get_session() as session:
-            # For now, return course promotion calls as campaigns
-            campaigns = session.query(CoursePromotionCall).filter(
-                CoursePromotionCall.practitioner_id == facilitator_id
-            ).all()
-            
-            return [{
-                'id': campaign.id,
-                'course_id': campaign.course_id,
-                'phone_number': campaign.phone_number,
-                'call_status': campaign.call_status,
-                'call_start_time': campaign.call_start_time.isoformat() if campaign.call_start_time else None,
-                'call_end_time': campaign.call_end_time.isoformat() if campaign.call_end_time else None,
-                'call_duration': campaign.call_duration,
-                'student_name': campaign.student_name,
-                'student_email': campaign.student_email,
-                'call_outcome': campaign.call_outcome,
-                'conversion_status': campaign.conversion_status,
-                'follow_up_required': campaign.follow_up_required,
-                'notes': campaign.notes,
-                'created_at': campaign.created_at.isoformat() if campaign.created_at else None,
-                'updated_at': campaign.updated_at.isoformat() if campaign.updated_at else None
-            } for campaign in campaigns]
+            result = session.execute(
+                _CAMPAIGNS_STMT, {'fid': facilitator_id}, execution_options={'yield_per': 500}
+            )
+            for row in result:
+                yield _row_to_dict(row)
     
     def create_campaign(self, facilitator_id: int, campaign_data: Dict[str, Any]) -> int:
         """Create new campaign - SECURE"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, session.begin():
             campaign = CoursePromotionCall(
                 practitioner_id=facilitator_id,
                 course_id=campaign_data.get('course_id'),
@@ -1879,67 +1831,84 @@ class CampaignRepository:
     
     def update_campaign(self, campaign_id: int, facilitator_id: int, update_data: Dict[str, Any]) -> bool:
         """Update campaign - SECURE"""
-        with self.db_manager.get_session() as session:
-            campaign = session.query(CoursePromotionCall).filter(
-                CoursePromotionCall.id == campaign_id,
-                CoursePromotionCall.practitioner_id == facilitator_id
-            ).first()
-            
-            if not campaign:
-                return False
-            
-            for key, value in update_data.items():
-                if hasattr(campaign, key):
-                    setattr(campaign, key, value)
-            
-            campaign.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+        values = {key: update_data[key] for key in update_data.keys() & _UPDATABLE[CoursePromotionCall]}
+        with self.db_manager.get_session() as session, session.begin():
+            # Ownership check folded into the UPDATE's WHERE clause - one statement
+            result = session.execute(
+                update(CoursePromotionCall).where(
+                    CoursePromotionCall.id == campaign_id,
+                    CoursePromotionCall.practitioner_id == facilitator_id
+                ).values(values or {'id': CoursePromotionCall.id}).execution_options(synchronize_session=False)
+            )
+            return result.rowcount > 0
     
     def delete_campaign(self, campaign_id: int, facilitator_id: int) -> bool:
         """Delete campaign - SECURE"""
-        with self.db_manager.get_session() as session:
-            campaign = session.query(CoursePromotionCall).filter(
-                CoursePromotionCall.id == campaign_id,
-                CoursePromotionCall.practitioner_id == facilitator_id
+        with self.db_manager.get_session() as session, session.begin():
+            deleted = session.execute(
+                delete(CoursePromotionCall).where(
+                    CoursePromotionCall.id == campaign_id,
+                    CoursePromotionCall.practitioner_id == facilitator_id
+                ).returning(CoursePromotionCall.id).execution_options(synchronize_session=False)
             ).first()
-            
-            if not campaign:
-                return False
-            
-            session.delete(campaign)
-            session.commit()
-            return True
+            return deleted is not None
     
     def update_campaign_status(self, campaign_id: int, status: str) -> bool:
         """Update campaign status - SECURE"""
+        with self.db_manager.get_session() as session, session.begin():
+            # Plain UPDATE - no ORM instance whose server-generated updated_at would need a refresh
+            result = session.execute(
+                update(CoursePromotionCall).where(
+                    CoursePromotionCall.id == campaign_id
+                ).values(call_status=status).execution_options(synchronize_session=False)
+            )
+            return result.rowcount > 0
+    
+    def _campaign_owned(self, session: Session, campaign_id: int, facilitator_id: int) -> bool:
+        """True if the campaign exists and belongs to the facilitator"""
+        return session.execute(
+            select(CoursePromotionCall.id).where(
+                CoursePromotionCall.id == campaign_id,
+                CoursePromotionCall.practitioner_id == facilitator_id
+            )
+        ).first() is not None
+    
+    def _campaign_targets_filter(self, facilitator_id: int) -> tuple:
+        """WHERE criteria for a campaign's target leads - the owning practitioner's active leads"""
+        return (
+            CoursePromotionLead.practitioner_id == facilitator_id,
+            CoursePromotionLead.is_active == True
+        )
+    
+    def get_campaign_targets(self, campaign_id: int, facilitator_id: int, limit: int = 200, offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """Get target students for a campaign - SECURE (paginated; None if the campaign isn't the facilitator's)"""
         with self.db_manager.get_session() as session:
-            campaign = session.query(CoursePromotionCall).filter(
-                CoursePromotionCall.id == campaign_id
-            ).first()
+            if not self._campaign_owned(session, campaign_id, facilitator_id):
+                return None
             
-            if not campaign:
-                return False
+            rows = session.execute(
+                select(
+                    CoursePromotionLead.id,
+                    CoursePromotionLead.name,
+                    CoursePromotionLead.phone_number,
+                    CoursePromotionLead.email,
+                    CoursePromotionLead.contact_status.label('status'),
+                    CoursePromotionLead.created_at
+                ).where(
+                    *self._campaign_targets_filter(facilitator_id)
+                ).order_by(CoursePromotionLead.id).limit(limit).offset(offset)
+            ).all()
             
-            campaign.call_status = status
-            campaign.updated_at = func.current_timestamp()
-            session.commit()
-            return True
+            return [_row_to_dict(row) for row in rows]
     
-    def get_campaign_targets(self, campaign_id: int) -> List[Dict[str, Any]]:
-        """Get target students for a campaign - SECURE"""
+    def count_campaign_targets(self, campaign_id: int, facilitator_id: int) -> Optional[int]:
+        """Count every target of a campaign, unpaginated - SECURE (None if the campaign isn't the facilitator's)"""
         with self.db_manager.get_session() as session:
-            # Get active students as potential targets
-            targets = session.query(CoursePromotionLead).filter(
-                CoursePromotionLead.is_active == True
-            ).all()
+            if not self._campaign_owned(session, campaign_id, facilitator_id):
+                return None
             
-            return [{
-                'id': target.id,
-                'name': target.name,
-                'phone_number': target.phone_number,
-                'email': target.email,
-                'student_type': target.student_type,
-                'status': target.status,
-                'created_at': target.created_at.isoformat() if target.created_at else None
-            } for target in targets]
+            return session.execute(
+                select(func.count()).select_from(CoursePromotionLead).where(
+                    *self._campaign_targets_filter(facilitator_id)
+                )
+            ).scalar_one()
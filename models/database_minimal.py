@@ -36,7 +36,7 @@ class Practitioner(Base):
     website_published = Column(Boolean, default=False)
     website_status = Column(String(20), default='draft')
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
 
 class DatabaseManager:
     """Minimal database manager for testing"""
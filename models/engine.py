@@ -0,0 +1,90 @@
+"""
+Process-wide SQLAlchemy engines
+Every model module's session factory gets its engine here, so one database URL
+maps to one connection pool per process, sized from Config. The dev/CI lazy-load
+guard lives here too, attached per session factory
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import raiseload, sessionmaker
+
+from config import Config
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+def _driver_options(database_url: str) -> Dict[str, Any]:
+    """create_engine options specific to the DBAPI named in the URL"""
+    if make_url(database_url).get_driver_name() == 'psycopg':
+        # psycopg 3 prepares a statement server-side from its first execution, so the hot
+        # point lookups (practitioner by phone, OTP verify/store) are planned once per connection
+        return {'connect_args': {'prepare_threshold': 1}}
+    # psycopg2: INSERT executemany becomes multi-row VALUES (insertmanyvalues),
+    # UPDATE/DELETE executemany goes through execute_batch
+    return {
+        'executemany_mode': 'values_plus_batch',
+        'insertmanyvalues_page_size': 1000,
+        'executemany_batch_page_size': 500,
+    }
+
+def get_engine(database_url: str) -> Engine:
+    """Process-wide engine per database URL - every session factory shares one connection pool"""
+    engine = _engines.get(database_url)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(database_url)
+            if engine is None:
+                engine = create_engine(
+                    database_url,
+                    pool_size=Config.DB_POOL_SIZE,
+                    max_overflow=Config.DB_MAX_OVERFLOW,
+                    pool_timeout=Config.DB_POOL_TIMEOUT,  # fail fast when the pool is exhausted
+                    pool_recycle=Config.DB_POOL_RECYCLE,
+                    pool_pre_ping=True,
+                    pool_use_lifo=True,  # reuse the warmest connections so idle ones can age out
+                    # Compiled-statement cache, sized above the default 500 so the repositories'
+                    # distinct statements don't evict each other
+                    query_cache_size=1200,
+                    echo=False,  # Set to True (or "debug") for SQL debugging
+                    **_driver_options(database_url)
+                )
+                _engines[database_url] = engine
+    return engine
+
+def dispose_engines():
+    """Close pooled connections of every engine (at process shutdown)"""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+
+def _reset_pools_after_fork():
+    """Forked workers must not reuse the parent's sockets; drop them without closing"""
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+def _raise_on_lazy_sql(execute_state):
+    """do_orm_execute hook: top-level ORM SELECTs get raiseload('*', sql_only=True)"""
+    if execute_state.is_select and not execute_state.is_column_load and not execute_state.is_relationship_load:
+        execute_state.statement = execute_state.statement.options(raiseload('*', sql_only=True))
+
+def guard_lazy_loads(session_factory: sessionmaker, enabled: Optional[bool] = None) -> None:
+    """Make relationship lazy loads that would emit SQL raise, for sessions from this factory
+
+    enabled defaults to the ORM_RAISE_ON_LAZY env var - set it in dev and CI so an N+1 fails
+    loudly and gets an explicit selectinload/joinedload. Explicit eager options on a query
+    still win. The wildcard also overrides mapper-level lazy='joined' defaults, so under the
+    guard a relationship that production loads through its joined default raises unless the
+    query asks for it with joinedload() - request such relationships explicitly.
+    """
+    if enabled is None:
+        enabled = bool(os.getenv('ORM_RAISE_ON_LAZY'))
+    if enabled:
+        event.listen(session_factory, 'do_orm_execute', _raise_on_lazy_sql)
@@ -3,14 +3,18 @@ SQLAlchemy ORM Models for Ahoum CRM System
 Replaces raw SQL with secure ORM patterns
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, Float, ARRAY, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy import insert, select, update, bindparam, lambda_stmt, Column, Integer, String, Text, Boolean, DateTime, Float, LargeBinary, ARRAY, JSON, ForeignKey, UniqueConstraint, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import sessionmaker, relationship, Session, raiseload
 from sqlalchemy.sql import func
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 import os
 
+from models.cache import TTLCache
+from models.engine import get_engine, dispose_engines, guard_lazy_loads
+
 Base = declarative_base()
 
 # =============================================================================
@@ -61,7 +65,7 @@ class Practitioner(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     call_transcripts = relationship("CallTranscript", back_populates="practitioner", cascade="all, delete-orphan")
@@ -156,7 +160,7 @@ class FacilitatorBasicInfo(Base):
     location = Column(String(255))
     email = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="basic_info")
@@ -167,10 +171,10 @@ class FacilitatorVisualProfile(Base):
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False)
-    banner_urls = Column(ARRAY(String))
+    banner_urls = Column(JSONB)
     profile_url = Column(String(500))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="visual_profile")
@@ -181,11 +185,11 @@ class FacilitatorProfessionalDetails(Base):
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False)
-    languages = Column(ARRAY(String))
-    teaching_styles = Column(ARRAY(String))
-    specializations = Column(ARRAY(String))
+    languages = Column(JSONB)
+    teaching_styles = Column(JSONB)
+    specializations = Column(JSONB)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="professional_details")
@@ -199,7 +203,7 @@ class FacilitatorBioAbout(Base):
     short_bio = Column(Text)
     detailed_intro = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="bio_about")
@@ -215,7 +219,7 @@ class FacilitatorWorkExperience(Base):
     duration = Column(String(100))
     description = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="work_experience")
@@ -231,7 +235,7 @@ class FacilitatorCertification(Base):
     date_received = Column(DateTime)
     credential_id = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="certifications")
@@ -243,10 +247,12 @@ class FacilitatorCertification(Base):
 class PhoneOTP(Base):
     """Manage OTP-based phone authentication"""
     __tablename__ = 'phone_otps'
+    # Indexes are declared on models.database.PhoneOTP and built by the migrations
     
     id = Column(Integer, primary_key=True)
-    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False, index=True)
-    otp = Column(String(10), nullable=False)
+    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False)
+    otp = Column(String(10))  # legacy plaintext, cleared by migrations/add_phone_otps_hash.py
+    otp_hash = Column(LargeBinary)  # HMAC-SHA256 of the OTP (models/otp.py)
     otp_type = Column(String(50), default='verification')
     expires_at = Column(DateTime, nullable=False)
     is_verified = Column(Boolean, default=False)
@@ -262,18 +268,19 @@ class PhoneOTP(Base):
 class Offering(Base):
     """Store courses/services offered by practitioners"""
     __tablename__ = 'offerings'
+    # Indexes are declared on models.database.Offering and built by the migrations
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     category = Column(String(100))
-    basic_info = Column(JSON)
-    details = Column(JSON)
-    price_schedule = Column(JSON)
+    basic_info = Column(JSONB)
+    details = Column(JSONB)
+    price_schedule = Column(JSONB)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="offerings")
@@ -281,6 +288,7 @@ class Offering(Base):
 class Course(Base):
     """Specific courses for promotional calling campaigns"""
     __tablename__ = 'courses'
+    # Indexes are declared on models.database.Course and built by the migrations
     
     id = Column(Integer, primary_key=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
@@ -290,7 +298,7 @@ class Course(Base):
     description = Column(Text, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="courses")
@@ -303,15 +311,10 @@ class DatabaseSession:
     """Secure database session manager with connection pooling"""
     
     def __init__(self, database_url: str):
-        self.engine = create_engine(
-            database_url,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=False  # Set to True for SQL debugging
-        )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.engine = get_engine(database_url)
+        # Returned instances outlive their session, so keep their loaded state after commit
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+        guard_lazy_loads(self.SessionLocal)
     
     def get_session(self) -> Session:
         """Get a database session with automatic cleanup"""
@@ -322,25 +325,102 @@ class DatabaseSession:
         Base.metadata.create_all(bind=self.engine)
     
     def close(self):
-        """Close all connections"""
-        self.engine.dispose()
+        """Release this session manager - the shared pool outlives it"""
+        pass
 
 # =============================================================================
 # SECURE REPOSITORY PATTERN
 # =============================================================================
 
+# Metadata-only projection for call history; the transcript blob columns are opt-in
+_CALL_HISTORY_COLUMNS = (
+    CallTranscript.id, CallTranscript.phone_number, CallTranscript.room_name,
+    CallTranscript.call_date, CallTranscript.call_status,
+    CallTranscript.call_duration_seconds, CallTranscript.created_at
+)
+_CALL_HISTORY_FULL_COLUMNS = _CALL_HISTORY_COLUMNS + (CallTranscript.transcript_json, CallTranscript.conversation_summary)
+
+# Hot lookups as lambda statements: SQLAlchemy caches the constructed statement on the
+# lambda's code object, so repeat calls skip building and compiling it. Only the bind
+# parameters vary between calls.
+_PHONE_SUMMARY_STMT = lambda_stmt(lambda: select(
+    Practitioner.id, Practitioner.name, Practitioner.subdomain
+).where(Practitioner.phone_number == bindparam('phone_number')))
+
+_CALL_HISTORY_STMT = lambda_stmt(lambda: select(*_CALL_HISTORY_COLUMNS).where(
+    CallTranscript.phone_number == bindparam('phone_number')
+).order_by(CallTranscript.created_at.desc()).limit(bindparam('limit')))
+
+_CALL_HISTORY_FULL_STMT = lambda_stmt(lambda: select(*_CALL_HISTORY_FULL_COLUMNS).where(
+    CallTranscript.phone_number == bindparam('phone_number')
+).order_by(CallTranscript.created_at.desc()).limit(bindparam('limit')))
+
+# phone_number -> (id, name, subdomain) or None; absorbs OTP retry bursts on the same phone
+_phone_cache = TTLCache(maxsize=50_000, ttl=2)
+_MISSING = object()
+
+def _profile_sql(bio_about: str, offering: str) -> str:
+    """Whole-profile query: every child table is a correlated subquery folded into one JSON row"""
+    return f"""
+        SELECT json_build_object(
+            'id', p.id,
+            'phone_number', p.phone_number,
+            'name', p.name,
+            'email', p.email,
+            'practice_type', p.practice_type,
+            'location', p.location,
+            'onboarding_step', p.onboarding_step,
+            'website_published', p.website_published,
+            'subdomain', p.subdomain,
+            'basic_info', (SELECT row_to_json(x) FROM facilitator_basic_info x WHERE x.practitioner_id = p.id),
+            'visual_profile', (SELECT row_to_json(x) FROM facilitator_visual_profile x WHERE x.practitioner_id = p.id),
+            'professional_details', (SELECT row_to_json(x) FROM facilitator_professional_details x WHERE x.practitioner_id = p.id),
+            'bio_about', (SELECT {bio_about} FROM facilitator_bio_about x WHERE x.practitioner_id = p.id),
+            'work_experience', COALESCE((SELECT json_agg(x ORDER BY x.id) FROM facilitator_work_experience x WHERE x.practitioner_id = p.id), '[]'),
+            'certifications', COALESCE((SELECT json_agg(x ORDER BY x.id) FROM facilitator_certifications x WHERE x.practitioner_id = p.id), '[]'),
+            'offerings', COALESCE((SELECT json_agg({offering} ORDER BY x.id) FROM offerings x WHERE x.practitioner_id = p.id), '[]'),
+            'call_summary', json_build_object(
+                'total_calls', (SELECT count(*) FROM call_transcripts t WHERE t.phone_number = p.phone_number),
+                'insights', (SELECT row_to_json(x) FROM practitioner_insights x WHERE x.phone_number = p.phone_number)
+            )
+        ) AS profile
+        FROM practitioners p
+        WHERE p.id = :practitioner_id
+    """
+
+# One round trip per profile; the summary variant leaves detailed_intro and offering payloads on the server
+_PROFILE_QUERY = text(_profile_sql('row_to_json(x)', 'x'))
+_PROFILE_SUMMARY_QUERY = text(_profile_sql(
+    "json_build_object('short_bio', x.short_bio)",
+    "json_build_object('id', x.id, 'title', x.title, 'category', x.category, 'is_active', x.is_active)"
+))
+
 class SecurePractitionerRepository:
     """Secure practitioner operations using ORM"""
     
+    # Columns update_practitioner may set; identity and timestamps are never caller-controlled
+    _UPDATABLE_COLS = frozenset(Practitioner.__table__.columns.keys()) - {'id', 'created_at', 'updated_at'}
+    
     def __init__(self, db_session: DatabaseSession):
         self.db_session = db_session
     
+    def get_summary_by_phone(self, phone_number: str) -> Optional[Tuple[int, Optional[str], Optional[str]]]:
+        """(id, name, subdomain) for a phone number, memoized for a few seconds (SQL injection safe)"""
+        summary = _phone_cache.get(phone_number, _MISSING)
+        if summary is _MISSING:
+            with self.db_session.get_session() as session:
+                row = session.execute(_PHONE_SUMMARY_STMT, {'phone_number': phone_number}).first()
+            summary = tuple(row) if row else None
+            _phone_cache.set(phone_number, summary)
+        return summary
+    
     def get_by_phone(self, phone_number: str) -> Optional[Practitioner]:
         """Get practitioner by phone number (SQL injection safe)"""
         with self.db_session.get_session() as session:
-            return session.query(Practitioner).filter(
-                Practitioner.phone_number == phone_number
-            ).first()
+            # Detached after return - relationships must not lazy-load
+            return session.execute(
+                select(Practitioner).where(Practitioner.phone_number == phone_number).options(raiseload('*'))
+            ).scalar_one_or_none()
     
     def create_practitioner(self, phone_number: str, **kwargs) -> Practitioner:
         """Create new practitioner (SQL injection safe)"""
@@ -349,61 +429,69 @@ class SecurePractitionerRepository:
             session.add(practitioner)
             session.commit()
             session.refresh(practitioner)
+            _phone_cache.pop(phone_number)
             return practitioner
     
     def update_practitioner(self, practitioner_id: int, **kwargs) -> Optional[Practitioner]:
         """Update practitioner (SQL injection safe)"""
-        with self.db_session.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
-                Practitioner.id == practitioner_id
-            ).first()
-            
-            if practitioner:
-                for key, value in kwargs.items():
-                    if hasattr(practitioner, key):
-                        setattr(practitioner, key, value)
-                
-                practitioner.updated_at = func.now()
-                session.commit()
-                session.refresh(practitioner)
-            
-            return practitioner
+        values = {key: value for key, value in kwargs.items() if key in self._UPDATABLE_COLS}
+        if not values:
+            with self.db_session.get_session() as session:
+                return session.get(Practitioner, practitioner_id)
+        
+        # Single UPDATE ... RETURNING; updated_at is set by the touch_updated_at trigger
+        with self.db_session.get_session() as session, session.begin():
+            practitioner = session.execute(
+                update(Practitioner).where(Practitioner.id == practitioner_id)
+                .values(**values).returning(Practitioner)
+                .execution_options(synchronize_session=False)
+            ).scalar_one_or_none()
+        
+        if practitioner is not None:
+            _phone_cache.pop(practitioner.phone_number)
+            if 'phone_number' in values:
+                _phone_cache.clear()
+        return practitioner
+    
+    # One-row-per-practitioner onboarding step tables (unique practitioner_id)
+    _STEP_MODELS = (FacilitatorBasicInfo, FacilitatorVisualProfile, FacilitatorProfessionalDetails, FacilitatorBioAbout)
     
-    def get_complete_profile(self, practitioner_id: int) -> Optional[Dict[str, Any]]:
-        """Get complete practitioner profile with all related data"""
+    def upsert_step(self, model, practitioner_id: int, **fields) -> int:
+        """Insert or update a practitioner's onboarding step row in one INSERT ... ON CONFLICT (SQL injection safe)
+        
+        Work experience and certifications hold many rows per practitioner and are plain inserts.
+        """
+        if model not in self._STEP_MODELS:
+            raise ValueError(f"{model.__name__} is not a one-row-per-practitioner step table")
+        
+        columns = model.__table__.columns.keys()
+        values = {key: value for key, value in fields.items() if key in columns and key not in ('id', 'practitioner_id')}
+        stmt = pg_insert(model).values(practitioner_id=practitioner_id, **values)
+        # An empty SET still has to touch the row so RETURNING yields its id
+        set_ = {key: stmt.excluded[key] for key in values} or {'practitioner_id': stmt.excluded.practitioner_id}
+        stmt = stmt.on_conflict_do_update(index_elements=['practitioner_id'], set_=set_).returning(model.id)
+        
+        with self.db_session.get_session() as session, session.begin():
+            step_id = session.execute(stmt).scalar_one()
+        
+        return step_id
+    
+    def get_complete_profile(self, practitioner_id: int, summary: bool = False) -> Optional[Dict[str, Any]]:
+        """Get complete practitioner profile with all related data
+        
+        summary=True is for list/preview views: the large bio and offering payload columns
+        stay on the server and are left out of the result.
+        """
         with self.db_session.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
-                Practitioner.id == practitioner_id
+            row = session.execute(
+                _PROFILE_SUMMARY_QUERY if summary else _PROFILE_QUERY,
+                {'practitioner_id': practitioner_id}
             ).first()
-            
-            if not practitioner:
-                return None
-            
-            # Build complete profile dictionary
-            profile = {
-                'id': practitioner.id,
-                'phone_number': practitioner.phone_number,
-                'name': practitioner.name,
-                'email': practitioner.email,
-                'practice_type': practitioner.practice_type,
-                'location': practitioner.location,
-                'onboarding_step': practitioner.onboarding_step,
-                'website_published': practitioner.website_published,
-                'subdomain': practitioner.subdomain,
-                'basic_info': practitioner.basic_info.__dict__ if practitioner.basic_info else None,
-                'visual_profile': practitioner.visual_profile.__dict__ if practitioner.visual_profile else None,
-                'professional_details': practitioner.professional_details.__dict__ if practitioner.professional_details else None,
-                'bio_about': practitioner.bio_about.__dict__ if practitioner.bio_about else None,
-                'work_experience': [exp.__dict__ for exp in practitioner.work_experience],
-                'certifications': [cert.__dict__ for cert in practitioner.certifications],
-                'offerings': [off.__dict__ for off in practitioner.offerings],
-                'call_summary': {
-                    'total_calls': len(practitioner.call_transcripts),
-                    'insights': practitioner.insights.__dict__ if practitioner.insights else None
-                }
-            }
-            
-            return profile
+        
+        if not row:
+            return None
+        
+        return row.profile
 
 class SecureCallRepository:
     """Secure call operations using ORM"""
@@ -411,45 +499,84 @@ class SecureCallRepository:
     def __init__(self, db_session: DatabaseSession):
         self.db_session = db_session
     
+    @staticmethod
+    def _transcript_values(phone_number: str, transcript_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values for a call_transcripts row"""
+        return {
+            'phone_number': phone_number,
+            'room_name': transcript_data.get('room_name', ''),
+            'user_id': transcript_data.get('user_id', ''),
+            'transcript_json': transcript_data.get('transcript_json', {}),
+            'conversation_summary': transcript_data.get('summary', ''),
+            'call_duration_seconds': transcript_data.get('duration', 0),
+            'call_status': transcript_data.get('status', 'completed')
+        }
+    
+    @staticmethod
+    def _outcome_values(phone_number: str, outcome_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values for a call_outcomes row"""
+        return {
+            'phone_number': phone_number,
+            'call_outcome': outcome_data.get('outcome'),
+            'approach_used': outcome_data.get('approach'),
+            'call_duration': outcome_data.get('duration'),
+            'objection_type': outcome_data.get('objection'),
+            'notes': outcome_data.get('notes', '')
+        }
+    
     def store_transcript(self, phone_number: str, transcript_data: Dict[str, Any]) -> CallTranscript:
         """Store call transcript (SQL injection safe)"""
-        with self.db_session.get_session() as session:
-            transcript = CallTranscript(
-                phone_number=phone_number,
-                room_name=transcript_data.get('room_name', ''),
-                user_id=transcript_data.get('user_id', ''),
-                transcript_json=transcript_data.get('transcript_json', {}),
-                conversation_summary=transcript_data.get('summary', ''),
-                call_duration_seconds=transcript_data.get('duration', 0),
-                call_status=transcript_data.get('status', 'completed')
-            )
-            session.add(transcript)
-            session.commit()
-            session.refresh(transcript)
-            return transcript
+        return self.store_transcripts_bulk([dict(transcript_data, phone_number=phone_number)])[0]
+    
+    def store_transcripts_bulk(self, records: List[Dict[str, Any]]) -> List[CallTranscript]:
+        """Store many transcripts with one multi-row INSERT ... RETURNING (SQL injection safe)
+        
+        Each record holds the store_transcript fields plus its 'phone_number'.
+        """
+        if not records:
+            return []
+        
+        rows = [self._transcript_values(record['phone_number'], record) for record in records]
+        with self.db_session.get_session() as session, session.begin():
+            return session.scalars(insert(CallTranscript).returning(CallTranscript), rows).all()
     
     def store_outcome(self, phone_number: str, outcome_data: Dict[str, Any]) -> CallOutcome:
         """Store call outcome (SQL injection safe)"""
-        with self.db_session.get_session() as session:
-            outcome = CallOutcome(
-                phone_number=phone_number,
-                call_outcome=outcome_data.get('outcome'),
-                approach_used=outcome_data.get('approach'),
-                call_duration=outcome_data.get('duration'),
-                objection_type=outcome_data.get('objection'),
-                notes=outcome_data.get('notes', '')
-            )
-            session.add(outcome)
-            session.commit()
-            session.refresh(outcome)
-            return outcome
+        return self.store_outcomes_bulk([dict(outcome_data, phone_number=phone_number)])[0]
     
-    def get_call_history(self, phone_number: str, limit: int = 10) -> List[CallTranscript]:
-        """Get recent call history (SQL injection safe)"""
+    def store_outcomes_bulk(self, records: List[Dict[str, Any]]) -> List[CallOutcome]:
+        """Store many call outcomes with one multi-row INSERT ... RETURNING (SQL injection safe)
+        
+        Each record holds the store_outcome fields plus its 'phone_number'.
+        """
+        if not records:
+            return []
+        
+        rows = [self._outcome_values(record['phone_number'], record) for record in records]
+        with self.db_session.get_session() as session, session.begin():
+            return session.scalars(insert(CallOutcome).returning(CallOutcome), rows).all()
+    
+    def get_call_history(self, phone_number: str, limit: int = 10,
+                         include_transcript: bool = True) -> List[Dict[str, Any]]:
+        """Get recent call history as plain dicts (SQL injection safe)"""
+        return list(self.iter_call_history(phone_number, limit, include_transcript))
+    
+    def iter_call_history(self, phone_number: str, limit: int = 10,
+                          include_transcript: bool = True) -> Iterator[Dict[str, Any]]:
+        """Stream recent call history through a server-side cursor (SQL injection safe)
+        
+        Rows come back as Core mappings, skipping ORM instance construction. With
+        include_transcript=False the transcript_json/conversation_summary columns stay on the server.
+        """
+        stmt = _CALL_HISTORY_FULL_STMT if include_transcript else _CALL_HISTORY_STMT
+        
         with self.db_session.get_session() as session:
-            return session.query(CallTranscript).filter(
-                CallTranscript.phone_number == phone_number
-            ).order_by(CallTranscript.created_at.desc()).limit(limit).all()
+            result = session.execute(
+                stmt, {'phone_number': phone_number, 'limit': limit},
+                execution_options={'yield_per': 100}
+            )
+            for row in result.mappings():
+                yield dict(row)
 
 # =============================================================================
 # MIGRATION UTILITIES
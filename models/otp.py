@@ -0,0 +1,16 @@
+"""
+OTP hashing shared by every phone_otps reader and writer
+Rows store HMAC-SHA256(OTP_HMAC_KEY, otp) in otp_hash; the plaintext otp column is legacy
+"""
+
+import hashlib
+import hmac
+
+from config import Config
+
+def hash_otp(otp: str) -> bytes:
+    """HMAC-SHA256 of an OTP - the only form phone_otps rows are written or matched by"""
+    if not Config.OTP_HMAC_KEY:
+        # An unkeyed hash over six digits is trivially reversible from a dump
+        raise RuntimeError("OTP_HMAC_KEY is not set")
+    return hmac.new(Config.OTP_HMAC_KEY.encode(), otp.encode(), hashlib.sha256).digest()
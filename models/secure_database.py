@@ -3,11 +3,16 @@ Secure Database Manager using SQLAlchemy ORM
 Replaces raw SQL with secure, injection-proof operations
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
-from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, selectinload, raiseload, load_only
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import or_, desc, asc, func, select, insert, update, literal, event, inspect
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from datetime import datetime, timedelta
 import logging
+import contextlib
+import sys
+from flask import g, has_app_context
+from models.otp import hash_otp
 from models.orm_models import (
     DatabaseSession, Practitioner, CallTranscript, CallOutcome, 
     PractitionerInsight, FacilitatorBasicInfo, FacilitatorVisualProfile,
@@ -21,29 +26,151 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Practitioner columns update_practitioner accepts, resolved against the mapper once at import
+_PRACTITIONER_UPDATABLE = frozenset({
+    'name', 'email', 'practice_type', 'location', 'about_us',
+    'website_url', 'social_media_links', 'is_contacted',
+    'last_contacted_date', 'contact_status', 'notes',
+    'onboarding_step', 'is_active', 'student_count',
+    'class_types', 'current_challenges', 'preferred_contact_method',
+    'business_details', 'subdomain', 'website_published',
+    'website_published_at', 'website_status'
+}) & frozenset(inspect(Practitioner).columns.keys())
+
+# Every mapped practitioner column, in table order
+_PRACTITIONER_COLUMNS = tuple(inspect(Practitioner).columns.keys())
+
+# Narrow projection for practitioner list pages - leaves notes/JSON blobs on the server
+PRACTITIONER_LIST_FIELDS = (
+    'id', 'name', 'phone_number', 'practice_type', 'location',
+    'onboarding_step', 'website_published'
+)
+
+
+# Profile sections: output key -> serialized columns of the loaded ORM object
+_PROFILE_FIELDS = (
+    'id', 'phone_number', 'name', 'email', 'practice_type', 'location', 'about_us',
+    'website_url', 'social_media_links', 'onboarding_step', 'is_active',
+    'website_published', 'subdomain', 'website_status', 'created_at', 'updated_at'
+)
+_PROFILE_SECTIONS = {
+    'basic_info': ('first_name', 'last_name', 'phone_number', 'location', 'email'),
+    'visual_profile': ('banner_urls', 'profile_url'),
+    'professional_details': ('languages', 'teaching_styles', 'specializations'),
+    'bio_about': ('short_bio', 'detailed_intro'),
+}
+_PROFILE_LISTS = {
+    'work_experience': ('id', 'job_title', 'company', 'duration', 'description'),
+    'certifications': ('id', 'certificate_name', 'issuing_organization', 'date_received', 'credential_id'),
+}
+
+def _serialize(obj, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Plain dict of loaded column values, dates as ISO strings
+    
+    Reads the instance __dict__ once instead of going through an instrumented
+    descriptor per attribute; every listed column must already be loaded.
+    """
+    state = obj.__dict__
+    result = {}
+    for field in fields:
+        value = state.get(field)
+        result[field] = value.isoformat() if hasattr(value, 'isoformat') else value
+    return result
+
+def _profile_load_options() -> list:
+    """One batched SELECT per profile relationship; anything not listed raises instead of lazy-loading"""
+    return [
+        *(selectinload(getattr(Practitioner, key)) for key in (*_PROFILE_SECTIONS, *_PROFILE_LISTS)),
+        raiseload('*')
+    ]
+
+def _profile_dict(practitioner: Practitioner) -> Dict[str, Any]:
+    """Complete profile of a practitioner loaded with _profile_load_options()"""
+    # Build complete profile
+    profile = _serialize(practitioner, _PROFILE_FIELDS)
+    
+    # Add related data
+    for key, fields in _PROFILE_SECTIONS.items():
+        section = practitioner.__dict__.get(key)
+        if section is not None:
+            profile[key] = _serialize(section, fields)
+    
+    # Add experience and certifications
+    for key, fields in _PROFILE_LISTS.items():
+        profile[key] = [_serialize(item, fields) for item in practitioner.__dict__.get(key, ())]
+    
+    return profile
+
+@contextlib.contextmanager
+def count_queries(connectable):
+    """Collect every SQL statement sent through an Engine or Connection inside the block
+    
+    Wrap a repository call to pin its query budget and catch reintroduced N+1 loads:
+        with count_queries(db_manager.db_session.engine) as queries:
+            repo.get_facilitator_profile(practitioner_id)
+        assert len(queries) <= 3
+    """
+    queries = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+    
+    event.listen(connectable, "before_cursor_execute", record)
+    try:
+        yield queries
+    finally:
+        event.remove(connectable, "before_cursor_execute", record)
+
 class SecureDatabaseManager:
     """
     Secure database manager replacing raw SQL with SQLAlchemy ORM
     Provides SQL injection protection and type safety
     """
     
+    # Connectivity is probed once per process; pool_pre_ping validates every later checkout
+    _connection_verified = False
+    
     def __init__(self):
         self.db_session = DatabaseSession(Config.POSTGRES_URL)
         self._test_connection()
     
     def _test_connection(self):
-        """Test database connectivity on initialization"""
+        """Test database connectivity on first initialization"""
+        if SecureDatabaseManager._connection_verified:
+            return
         try:
             with self.db_session.get_session() as session:
-                session.execute("SELECT 1")
+                session.execute(select(literal(1))).scalar()
+            SecureDatabaseManager._connection_verified = True
             logger.info("✅ Database connection established successfully")
         except Exception as e:
             logger.error(f"❌ Database connection failed: {e}")
             raise
     
-    def get_session(self) -> Session:
-        """Get a database session for manual operations"""
-        return self.db_session.get_session()
+    @contextlib.contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """Database session for one repository operation
+        
+        Inside a Flask request every operation reuses one request-scoped Session instead of
+        building a new one per call. Each block still ends like a closed per-call session:
+        loaded objects are detached and any open transaction is ended, so no connection is
+        held between operations. Outside a request, or when blocks nest, a fresh session is used.
+        """
+        if not has_app_context() or g.get('secure_db_session_active'):
+            with self.db_session.get_session() as session:
+                yield session
+            return
+        
+        session = g.get('secure_db_session')
+        if session is None:
+            session = g.secure_db_session = self.db_session.get_session()
+        g.secure_db_session_active = True
+        try:
+            yield session
+        finally:
+            g.secure_db_session_active = False
+            session.expunge_all()
+            session.rollback()
     
     def close_connection(self):
         """Close database connections"""
@@ -63,302 +190,218 @@ class SecureFacilitatorRepository:
     # CORE PRACTITIONER OPERATIONS
     # -------------------------------------------------------------------------
     
-    def get_practitioner_by_phone(self, phone_number: str) -> Optional[Practitioner]:
-        """Get practitioner by phone number (SQL injection safe)"""
+    def get_practitioner_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Get practitioner columns by phone number (SQL injection safe)"""
         with self.db_manager.get_session() as session:
-            return session.query(Practitioner).filter(
-                Practitioner.phone_number == phone_number
-            ).first()
+            found = session.execute(
+                select(Practitioner.__table__).where(Practitioner.phone_number == phone_number)
+            ).mappings().first()
+            return dict(found) if found is not None else None
     
-    def get_practitioner_by_id(self, practitioner_id: int) -> Optional[Practitioner]:
-        """Get practitioner by ID (SQL injection safe)"""
+    def get_practitioner_by_id(self, practitioner_id: int) -> Optional[Dict[str, Any]]:
+        """Get practitioner columns by ID (SQL injection safe)"""
         with self.db_manager.get_session() as session:
-            return session.query(Practitioner).filter(
-                Practitioner.id == practitioner_id
-            ).first()
+            practitioner = session.get(Practitioner, practitioner_id)
+            if practitioner is None:
+                return None
+            return {key: getattr(practitioner, key) for key in _PRACTITIONER_COLUMNS}
     
     def create_practitioner(self, phone_number: str, **kwargs) -> Practitioner:
         """Create new practitioner (SQL injection safe)"""
-        with self.db_manager.get_session() as session:
-            # Check if practitioner already exists
-            existing = session.query(Practitioner).filter(
-                Practitioner.phone_number == phone_number
-            ).first()
-            
-            if existing:
-                raise ValueError(f"Practitioner with phone {phone_number} already exists")
-            
-            practitioner = Practitioner(phone_number=phone_number, **kwargs)
-            session.add(practitioner)
-            session.commit()
-            session.refresh(practitioner)
-            return practitioner
+        # Atomic insert-if-absent: an existing phone number yields no RETURNING row
+        stmt = pg_insert(Practitioner).values(phone_number=phone_number, **kwargs).on_conflict_do_nothing(
+            index_elements=['phone_number']
+        ).returning(Practitioner)
+        
+        with self.db_manager.get_session() as session, session.begin():
+            practitioner = session.execute(stmt).scalar_one_or_none()
+        
+        if practitioner is None:
+            raise ValueError(f"Practitioner with phone {phone_number} already exists")
+        return practitioner
     
     def update_practitioner(self, practitioner_id: int, **kwargs) -> Optional[Practitioner]:
         """Update practitioner (SQL injection safe)"""
-        with self.db_manager.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
-                Practitioner.id == practitioner_id
-            ).first()
-            
-            if not practitioner:
-                return None
-            
-            # Update allowed fields only
-            allowed_fields = {
-                'name', 'email', 'practice_type', 'location', 'about_us',
-                'website_url', 'social_media_links', 'is_contacted',
-                'last_contacted_date', 'contact_status', 'notes',
-                'onboarding_step', 'is_active', 'student_count',
-                'class_types', 'current_challenges', 'preferred_contact_method',
-                'business_details', 'subdomain', 'website_published',
-                'website_published_at', 'website_status'
-            }
-            
-            for key, value in kwargs.items():
-                if key in allowed_fields and hasattr(practitioner, key):
-                    setattr(practitioner, key, value)
-            
-            practitioner.updated_at = func.now()
-            session.commit()
-            session.refresh(practitioner)
-            return practitioner
+        # Update allowed fields only
+        updates = {key: value for key, value in kwargs.items() if key in _PRACTITIONER_UPDATABLE}
+        
+        # One round trip: the UPDATE hands back the updated row, None for an unknown id.
+        # updated_at is stamped by the touch_updated_at trigger; SET id = id keeps an empty update valid
+        stmt = update(Practitioner).where(
+            Practitioner.id == practitioner_id
+        ).values(updates or {'id': Practitioner.id}).returning(Practitioner)
+        
+        with self.db_manager.get_session() as session, session.begin():
+            practitioner = session.execute(
+                stmt, execution_options={'populate_existing': True}
+            ).scalar_one_or_none()
+        
+        return practitioner
     
     def get_facilitator_profile(self, practitioner_id: int) -> Optional[Dict[str, Any]]:
         """Get complete facilitator profile with all related data"""
         with self.db_manager.get_session() as session:
-            practitioner = session.query(Practitioner).filter(
-                Practitioner.id == practitioner_id
-            ).first()
+            practitioner = session.get(Practitioner, practitioner_id, options=_profile_load_options())
             
             if not practitioner:
                 return None
             
-            # Build complete profile
-            profile = {
-                'id': practitioner.id,
-                'phone_number': practitioner.phone_number,
-                'name': practitioner.name,
-                'email': practitioner.email,
-                'practice_type': practitioner.practice_type,
-                'location': practitioner.location,
-                'about_us': practitioner.about_us,
-                'website_url': practitioner.website_url,
-                'social_media_links': practitioner.social_media_links,
-                'onboarding_step': practitioner.onboarding_step,
-                'is_active': practitioner.is_active,
-                'website_published': practitioner.website_published,
-                'subdomain': practitioner.subdomain,
-                'website_status': practitioner.website_status,
-                'created_at': practitioner.created_at.isoformat() if practitioner.created_at else None,
-                'updated_at': practitioner.updated_at.isoformat() if practitioner.updated_at else None,
-            }
-            
-            # Add related data
-            if practitioner.basic_info:
-                profile['basic_info'] = {
-                    'first_name': practitioner.basic_info.first_name,
-                    'last_name': practitioner.basic_info.last_name,
-                    'phone_number': practitioner.basic_info.phone_number,
-                    'location': practitioner.basic_info.location,
-                    'email': practitioner.basic_info.email
-                }
-            
-            if practitioner.visual_profile:
-                profile['visual_profile'] = {
-                    'banner_urls': practitioner.visual_profile.banner_urls,
-                    'profile_url': practitioner.visual_profile.profile_url
-                }
-            
-            if practitioner.professional_details:
-                profile['professional_details'] = {
-                    'languages': practitioner.professional_details.languages,
-                    'teaching_styles': practitioner.professional_details.teaching_styles,
-                    'specializations': practitioner.professional_details.specializations
-                }
-            
-            if practitioner.bio_about:
-                profile['bio_about'] = {
-                    'short_bio': practitioner.bio_about.short_bio,
-                    'detailed_intro': practitioner.bio_about.detailed_intro
-                }
-            
-            # Add experience and certifications
-            profile['work_experience'] = []
-            for exp in practitioner.work_experience:
-                profile['work_experience'].append({
-                    'id': exp.id,
-                    'job_title': exp.job_title,
-                    'company': exp.company,
-                    'duration': exp.duration,
-                    'description': exp.description
-                })
-            
-            profile['certifications'] = []
-            for cert in practitioner.certifications:
-                profile['certifications'].append({
-                    'id': cert.id,
-                    'certificate_name': cert.certificate_name,
-                    'issuing_organization': cert.issuing_organization,
-                    'date_received': cert.date_received.isoformat() if cert.date_received else None,
-                    'credential_id': cert.credential_id
-                })
-            
-            return profile
+            return _profile_dict(practitioner)
     
     # -------------------------------------------------------------------------
     # ONBOARDING OPERATIONS
     # -------------------------------------------------------------------------
     
+    # Columns callers may never set through a step data dict
+    _STEP_PROTECTED = frozenset({'id', 'practitioner_id', 'created_at', 'updated_at'})
+    
+    def _upsert_one_to_one(self, session: Session, model, practitioner_id: int, data: Dict[str, Any]):
+        """INSERT ... ON CONFLICT (practitioner_id) DO UPDATE for a one-row-per-practitioner step table
+        
+        updated_at is left to the touch_updated_at trigger
+        """
+        values = {
+            key: value for key, value in data.items()
+            if key in model.__table__.columns and key not in self._STEP_PROTECTED
+        }
+        stmt = pg_insert(model).values(practitioner_id=practitioner_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['practitioner_id'],
+            set_={key: stmt.excluded[key] for key in values} or {'practitioner_id': practitioner_id}
+        )
+        session.execute(stmt)
+    
     def update_basic_info(self, practitioner_id: int, basic_info_data: Dict[str, Any]) -> bool:
         """Update or create basic info (Step 1)"""
-        with self.db_manager.get_session() as session:
-            # Check if basic info exists
-            basic_info = session.query(FacilitatorBasicInfo).filter(
-                FacilitatorBasicInfo.practitioner_id == practitioner_id
-            ).first()
-            
-            if basic_info:
-                # Update existing
-                for key, value in basic_info_data.items():
-                    if hasattr(basic_info, key):
-                        setattr(basic_info, key, value)
-                basic_info.updated_at = func.now()
-            else:
-                # Create new
-                basic_info = FacilitatorBasicInfo(
-                    practitioner_id=practitioner_id,
-                    **basic_info_data
-                )
-                session.add(basic_info)
-            
-            session.commit()
-            return True
+        with self.db_manager.get_session() as session, session.begin():
+            self._upsert_one_to_one(session, FacilitatorBasicInfo, practitioner_id, basic_info_data)
+        return True
     
     def update_visual_profile(self, practitioner_id: int, visual_data: Dict[str, Any]) -> bool:
         """Update or create visual profile (Step 2)"""
-        with self.db_manager.get_session() as session:
-            visual_profile = session.query(FacilitatorVisualProfile).filter(
-                FacilitatorVisualProfile.practitioner_id == practitioner_id
-            ).first()
-            
-            if visual_profile:
-                for key, value in visual_data.items():
-                    if hasattr(visual_profile, key):
-                        setattr(visual_profile, key, value)
-                visual_profile.updated_at = func.now()
-            else:
-                visual_profile = FacilitatorVisualProfile(
-                    practitioner_id=practitioner_id,
-                    **visual_data
-                )
-                session.add(visual_profile)
-            
-            session.commit()
-            return True
+        with self.db_manager.get_session() as session, session.begin():
+            self._upsert_one_to_one(session, FacilitatorVisualProfile, practitioner_id, visual_data)
+        return True
     
     def update_professional_details(self, practitioner_id: int, professional_data: Dict[str, Any]) -> bool:
         """Update or create professional details (Step 3)"""
-        with self.db_manager.get_session() as session:
-            professional = session.query(FacilitatorProfessionalDetails).filter(
-                FacilitatorProfessionalDetails.practitioner_id == practitioner_id
-            ).first()
-            
-            if professional:
-                for key, value in professional_data.items():
-                    if hasattr(professional, key):
-                        setattr(professional, key, value)
-                professional.updated_at = func.now()
-            else:
-                professional = FacilitatorProfessionalDetails(
-                    practitioner_id=practitioner_id,
-                    **professional_data
-                )
-                session.add(professional)
-            
-            session.commit()
-            return True
+        with self.db_manager.get_session() as session, session.begin():
+            self._upsert_one_to_one(session, FacilitatorProfessionalDetails, practitioner_id, professional_data)
+        return True
     
     def update_bio_about(self, practitioner_id: int, bio_data: Dict[str, Any]) -> bool:
         """Update or create bio and about (Step 4)"""
-        with self.db_manager.get_session() as session:
-            bio_about = session.query(FacilitatorBioAbout).filter(
-                FacilitatorBioAbout.practitioner_id == practitioner_id
-            ).first()
-            
-            if bio_about:
-                for key, value in bio_data.items():
-                    if hasattr(bio_about, key):
-                        setattr(bio_about, key, value)
-                bio_about.updated_at = func.now()
-            else:
-                bio_about = FacilitatorBioAbout(
-                    practitioner_id=practitioner_id,
-                    **bio_data
-                )
-                session.add(bio_about)
-            
-            session.commit()
-            return True
+        with self.db_manager.get_session() as session, session.begin():
+            self._upsert_one_to_one(session, FacilitatorBioAbout, practitioner_id, bio_data)
+        return True
     
     def add_work_experience(self, practitioner_id: int, experience_data: Dict[str, Any]) -> int:
         """Add work experience (Step 5)"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, session.begin():
             experience = FacilitatorWorkExperience(
                 practitioner_id=practitioner_id,
                 **experience_data
             )
             session.add(experience)
-            session.commit()
-            session.refresh(experience)
+            # INSERT ... RETURNING fills the id at flush, no refresh SELECT needed
+            session.flush()
             return experience.id
     
     def add_certification(self, practitioner_id: int, cert_data: Dict[str, Any]) -> int:
         """Add certification (Step 6)"""
-        with self.db_manager.get_session() as session:
-            certification = FacilitatorCertification(
-                practitioner_id=practitioner_id,
-                **cert_data
-            )
-            session.add(certification)
-            session.commit()
-            session.refresh(certification)
-            return certification.id
+        return self.add_certifications_bulk(practitioner_id, [cert_data])[0]
+    
+    def add_certifications_bulk(self, practitioner_id: int, certs: List[Dict[str, Any]]) -> List[int]:
+        """Add many certifications with one multi-row INSERT ... RETURNING, in one transaction"""
+        if not certs:
+            return []
+        
+        rows = [dict(cert_data, practitioner_id=practitioner_id) for cert_data in certs]
+        with self.db_manager.get_session() as session, session.begin():
+            return session.scalars(
+                insert(FacilitatorCertification).returning(
+                    FacilitatorCertification.id, sort_by_parameter_order=True
+                ),
+                rows
+            ).all()
     
     # -------------------------------------------------------------------------
     # LISTING AND SEARCH OPERATIONS
     # -------------------------------------------------------------------------
     
+    @staticmethod
+    def _apply_practitioner_filters(query, filters: Dict[str, Any]):
+        """Apply listing filters securely"""
+        if filters.get('practice_type'):
+            query = query.filter(Practitioner.practice_type == filters['practice_type'])
+        
+        if filters.get('location'):
+            query = query.filter(Practitioner.location.ilike(f"%{filters['location']}%"))
+        
+        if filters.get('onboarding_step'):
+            query = query.filter(Practitioner.onboarding_step == filters['onboarding_step'])
+        
+        if filters.get('is_contacted') is not None:
+            query = query.filter(Practitioner.is_contacted == filters['is_contacted'])
+        
+        if filters.get('website_published') is not None:
+            query = query.filter(Practitioner.website_published == filters['website_published'])
+        
+        return query
+    
+    @staticmethod
+    def _page_with_total(query, page: int, page_size: int) -> Tuple[List[Any], int]:
+        """Page rows and the total in one round trip
+        
+        COUNT(*) OVER () is computed before LIMIT/OFFSET, so every row carries the full
+        filtered count. Rows come back without the trailing total column.
+        """
+        offset = (page - 1) * page_size
+        rows = query.add_columns(func.count().over().label('total_count')).order_by(
+            Practitioner.id
+        ).offset(offset).limit(page_size).all()
+        
+        if rows:
+            total_count = rows[0].total_count
+        else:
+            # A page past the end has no rows to carry the total
+            total_count = query.count() if offset else 0
+        
+        return [row[:-1] for row in rows], total_count
+    
     def get_practitioners_by_filters(self, filters: Dict[str, Any], 
-                                   page: int = 1, page_size: int = 20) -> Tuple[List[Practitioner], int]:
-        """Get practitioners with filters and pagination"""
+                                   page: int = 1, page_size: int = 20,
+                                   fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Practitioner], int]:
+        """Get practitioners with filters and pagination
+        
+        fields limits the columns loaded (e.g. PRACTITIONER_LIST_FIELDS); reading any other
+        column from a returned practitioner raises instead of querying.
+        """
         with self.db_manager.get_session() as session:
-            query = session.query(Practitioner)
-            
-            # Apply filters securely
-            if filters.get('practice_type'):
-                query = query.filter(Practitioner.practice_type == filters['practice_type'])
-            
-            if filters.get('location'):
-                query = query.filter(Practitioner.location.ilike(f"%{filters['location']}%"))
-            
-            if filters.get('onboarding_step'):
-                query = query.filter(Practitioner.onboarding_step == filters['onboarding_step'])
-            
-            if filters.get('is_contacted') is not None:
-                query = query.filter(Practitioner.is_contacted == filters['is_contacted'])
-            
-            if filters.get('website_published') is not None:
-                query = query.filter(Practitioner.website_published == filters['website_published'])
-            
-            # Get total count
-            total_count = query.count()
-            
-            # Apply pagination
-            offset = (page - 1) * page_size
-            practitioners = query.offset(offset).limit(page_size).all()
-            
-            return practitioners, total_count
+            query = self._apply_practitioner_filters(
+                session.query(Practitioner).options(raiseload('*')), filters
+            )
+            if fields:
+                query = query.options(load_only(
+                    *(getattr(Practitioner, name) for name in fields if name in Practitioner.__table__.columns),
+                    raiseload=True
+                ))
+            
+            rows, total_count = self._page_with_total(query, page, page_size)
+            return [row[0] for row in rows], total_count
+    
+    def get_practitioner_summaries_by_filters(self, filters: Dict[str, Any],
+                                              page: int = 1, page_size: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+        """Filtered, paginated practitioner list as plain dicts of PRACTITIONER_LIST_FIELDS
+        
+        Selects bare columns, so no ORM instances or identity-map entries are built.
+        """
+        with self.db_manager.get_session() as session:
+            query = self._apply_practitioner_filters(
+                session.query(*(getattr(Practitioner, name) for name in PRACTITIONER_LIST_FIELDS)), filters
+            )
+            rows, total_count = self._page_with_total(query, page, page_size)
+            return [dict(zip(PRACTITIONER_LIST_FIELDS, row)) for row in rows], total_count
 
 # =============================================================================
 # SECURE CALLING OPERATIONS
@@ -370,58 +413,86 @@ class SecureCallRepository:
     def __init__(self, db_manager: SecureDatabaseManager):
         self.db_manager = db_manager
     
+    @staticmethod
+    def _transcript_values(phone_number: str, transcript_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values for one call_transcripts row"""
+        return {
+            'phone_number': phone_number,
+            'room_name': transcript_data.get('room_name', ''),
+            'user_id': transcript_data.get('user_id', ''),
+            'call_date': transcript_data.get('call_date', ''),
+            'transcript_json': transcript_data.get('transcript_json', {}),
+            'conversation_summary': transcript_data.get('conversation_summary', ''),
+            'call_duration_seconds': transcript_data.get('call_duration_seconds', 0),
+            'call_status': transcript_data.get('call_status', 'completed')
+        }
+    
+    @staticmethod
+    def _outcome_values(phone_number: str, outcome_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values for one call_outcomes row"""
+        return {
+            'phone_number': phone_number,
+            'call_outcome': outcome_data.get('call_outcome', ''),
+            'approach_used': outcome_data.get('approach_used', ''),
+            'call_duration': outcome_data.get('call_duration', 0),
+            'objection_type': outcome_data.get('objection_type', ''),
+            'notes': outcome_data.get('notes', '')
+        }
+    
+    def _insert_returning_ids(self, model, rows: List[Dict[str, Any]]) -> List[int]:
+        """One executemany INSERT ... RETURNING id for all rows, committed atomically"""
+        if not rows:
+            return []
+        with self.db_manager.get_session() as session, session.begin():
+            return session.scalars(
+                insert(model).returning(model.id, sort_by_parameter_order=True), rows
+            ).all()
+    
     def store_call_transcript(self, phone_number: str, transcript_data: Dict[str, Any]) -> int:
         """Store call transcript securely"""
-        with self.db_manager.get_session() as session:
-            transcript = CallTranscript(
-                phone_number=phone_number,
-                room_name=transcript_data.get('room_name', ''),
-                user_id=transcript_data.get('user_id', ''),
-                call_date=transcript_data.get('call_date', ''),
-                transcript_json=transcript_data.get('transcript_json', {}),
-                conversation_summary=transcript_data.get('conversation_summary', ''),
-                call_duration_seconds=transcript_data.get('call_duration_seconds', 0),
-                call_status=transcript_data.get('call_status', 'completed')
-            )
-            session.add(transcript)
-            session.commit()
-            session.refresh(transcript)
-            return transcript.id
+        return self.store_call_transcripts_bulk([dict(transcript_data, phone_number=phone_number)])[0]
+    
+    def store_call_transcripts_bulk(self, items: List[Dict[str, Any]]) -> List[int]:
+        """Store many call transcripts in one round trip
+        
+        Each item holds the store_call_transcript fields plus its 'phone_number'.
+        Ids are returned in input order.
+        """
+        return self._insert_returning_ids(
+            CallTranscript, [self._transcript_values(item['phone_number'], item) for item in items]
+        )
     
     def store_call_outcome(self, phone_number: str, outcome_data: Dict[str, Any]) -> int:
         """Store call outcome securely"""
-        with self.db_manager.get_session() as session:
-            outcome = CallOutcome(
-                phone_number=phone_number,
-                call_outcome=outcome_data.get('call_outcome', ''),
-                approach_used=outcome_data.get('approach_used', ''),
-                call_duration=outcome_data.get('call_duration', 0),
-                objection_type=outcome_data.get('objection_type', ''),
-                notes=outcome_data.get('notes', '')
-            )
-            session.add(outcome)
-            session.commit()
-            session.refresh(outcome)
-            return outcome.id
+        return self.store_call_outcomes_bulk([dict(outcome_data, phone_number=phone_number)])[0]
+    
+    def store_call_outcomes_bulk(self, items: List[Dict[str, Any]]) -> List[int]:
+        """Store many call outcomes in one round trip
+        
+        Each item holds the store_call_outcome fields plus its 'phone_number'.
+        Ids are returned in input order.
+        """
+        return self._insert_returning_ids(
+            CallOutcome, [self._outcome_values(item['phone_number'], item) for item in items]
+        )
     
     def get_call_history(self, phone_number: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get call history for a phone number"""
+        # Only the listed columns travel; transcript_json (often 100KB+) stays on the server
+        stmt = select(
+            CallTranscript.id, CallTranscript.room_name, CallTranscript.call_date,
+            CallTranscript.call_duration_seconds, CallTranscript.call_status,
+            CallTranscript.conversation_summary, CallTranscript.created_at
+        ).where(
+            CallTranscript.phone_number == phone_number
+        ).order_by(desc(CallTranscript.created_at)).limit(limit)
+        
         with self.db_manager.get_session() as session:
-            transcripts = session.query(CallTranscript).filter(
-                CallTranscript.phone_number == phone_number
-            ).order_by(desc(CallTranscript.created_at)).limit(limit).all()
-            
             history = []
-            for transcript in transcripts:
-                history.append({
-                    'id': transcript.id,
-                    'room_name': transcript.room_name,
-                    'call_date': transcript.call_date,
-                    'call_duration_seconds': transcript.call_duration_seconds,
-                    'call_status': transcript.call_status,
-                    'conversation_summary': transcript.conversation_summary,
-                    'created_at': transcript.created_at.isoformat() if transcript.created_at else None
-                })
+            for row in session.execute(stmt).mappings():
+                entry = dict(row)
+                entry['created_at'] = row['created_at'].isoformat() if row['created_at'] else None
+                history.append(entry)
             
             return history
     
@@ -460,71 +531,88 @@ class SecureAuthRepository:
         self.db_manager = db_manager
     
     def store_otp(self, phone_number: str, otp: str, expires_at: datetime) -> int:
-        """Store OTP securely"""
-        with self.db_manager.get_session() as session:
-            # Remove any existing OTPs for this phone number
-            session.query(PhoneOTP).filter(
-                PhoneOTP.phone_number == phone_number
-            ).delete()
-            
-            # Create new OTP
-            phone_otp = PhoneOTP(
-                phone_number=phone_number,
-                otp=otp,
-                expires_at=expires_at
-            )
-            session.add(phone_otp)
-            session.commit()
-            session.refresh(phone_otp)
-            return phone_otp.id
+        """Store OTP securely
+        
+        Replaces the phone's pending OTP in place (one upsert on ux_phone_otps_phone_pending),
+        so there is never a moment without a valid row between removing the old one and
+        inserting the new one.
+        """
+        stmt = pg_insert(PhoneOTP).values(
+            phone_number=phone_number,
+            otp=None,
+            otp_hash=hash_otp(otp),
+            expires_at=expires_at,
+            is_verified=False
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['phone_number'],
+            index_where=PhoneOTP.is_verified == False,
+            set_={
+                'otp': stmt.excluded.otp,
+                'otp_hash': stmt.excluded.otp_hash,
+                'expires_at': stmt.excluded.expires_at,
+                'created_at': func.now()
+            }
+        ).returning(PhoneOTP.id)
+        
+        with self.db_manager.get_session() as session, session.begin():
+            return session.execute(stmt).scalar_one()
     
     def verify_otp(self, phone_number: str, otp: str) -> bool:
-        """Verify OTP securely"""
-        with self.db_manager.get_session() as session:
-            phone_otp = session.query(PhoneOTP).filter(
-                and_(
-                    PhoneOTP.phone_number == phone_number,
-                    PhoneOTP.otp == otp,
-                    PhoneOTP.expires_at > func.now(),
-                    PhoneOTP.is_verified == False
-                )
-            ).first()
-            
-            if phone_otp:
-                phone_otp.is_verified = True
-                session.commit()
-                return True
-            
-            return False
+        """Verify OTP securely
+        
+        Matching and consuming happen in one UPDATE ... RETURNING, so an OTP can be
+        verified at most once even under concurrent requests. The plaintext OTP never
+        reaches the database; rows are matched on its HMAC.
+        """
+        stmt = update(PhoneOTP).where(
+            PhoneOTP.phone_number == phone_number,
+            PhoneOTP.otp_hash == hash_otp(otp),
+            PhoneOTP.expires_at > func.now(),
+            PhoneOTP.is_verified == False
+        ).values(is_verified=True).returning(PhoneOTP.id)
+        
+        with self.db_manager.get_session() as session, session.begin():
+            return session.execute(stmt).first() is not None
 
 # =============================================================================
 # MIGRATION HELPER
 # =============================================================================
 
+# Statements a batch of profile loads may issue: the practitioners plus one per relationship
+PROFILE_QUERY_BUDGET = 1 + len(_PROFILE_SECTIONS) + len(_PROFILE_LISTS)
+
 def test_orm_migration():
-    """Test ORM models against existing database"""
+    """Test ORM models against existing database
+    
+    Loads a few complete profiles in one session with the repository's eager-load options.
+    The statement count is the canary: a lazy load reintroduced into the profile shape
+    raises, and a missing eager option shows up as a blown query budget.
+    """
     try:
         db_manager = SecureDatabaseManager()
-        facilitator_repo = SecureFacilitatorRepository(db_manager)
         
-        # Test basic operations
-        practitioners = []
-        with db_manager.get_session() as session:
-            practitioners = session.query(Practitioner).limit(3).all()
+        with db_manager.get_session() as session, count_queries(db_manager.db_session.engine) as queries:
+            practitioners = session.scalars(
+                select(Practitioner).options(*_profile_load_options()).order_by(Practitioner.id).limit(3)
+            ).all()
+            profiles = [_profile_dict(p) for p in practitioners]
         
         print("✅ ORM Models Working Successfully!")
         print(f"✅ Found {len(practitioners)} practitioners in database")
         
-        for p in practitioners:
-            print(f"   - {p.name or 'Unknown'} ({p.phone_number})")
-        
-        # Test repository operations
-        if practitioners:
-            first_practitioner = practitioners[0]
-            profile = facilitator_repo.get_facilitator_profile(first_practitioner.id)
-            print(f"✅ Successfully retrieved profile for practitioner {first_practitioner.id}")
+        for profile in profiles:
+            print(f"   - {profile['name'] or 'Unknown'} ({profile['phone_number']})")
         
         db_manager.close_connection()
+        
+        if len(queries) > PROFILE_QUERY_BUDGET:
+            print(f"❌ Profile load issued {len(queries)} queries, over its budget of {PROFILE_QUERY_BUDGET} - check for N+1 relationship loads")
+            return False
+        
+        if profiles:
+            print(f"✅ Successfully built {len(profiles)} profiles ({len(queries)} queries)")
+        
         return True
         
     except Exception as e:
@@ -538,3 +626,4 @@ if __name__ == "__main__":
         print("Your data is safe and ORM models are working correctly.")
     else:
         print("\n⚠️  Please check the error above before proceeding.")
+        sys.exit(1)
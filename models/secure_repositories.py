@@ -3,14 +3,17 @@ Secure Repository Implementations using SQLAlchemy ORM
 Replaces raw SQL operations with secure ORM patterns
 """
 
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, func, select, text
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+from sqlalchemy import or_, func, select, insert, update, delete, case, cast, inspect, text, Float, bindparam, lambda_stmt
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 import json
 
+from .cache import TTLCache
+from .otp import hash_otp
 from .sqlalchemy_models import (
     DatabaseEngine, SecureRepository,
     Practitioner, CallTranscript, CallOutcome, PractitionerInsight,
@@ -21,6 +24,74 @@ from .sqlalchemy_models import (
 
 logger = logging.getLogger(__name__)
 
+# Practitioner fields each read returns, in output order
+_VIEWS = {
+    'basic': (
+        'id', 'phone_number', 'name', 'email', 'practice_type', 'location', 'about_us',
+        'website_url', 'social_media_links', 'is_contacted', 'contact_status',
+        'onboarding_step', 'is_active', 'created_at', 'updated_at'
+    ),
+    'search': (
+        'id', 'name', 'phone_number', 'email', 'practice_type', 'location', 'is_active',
+        'onboarding_step', 'created_at'
+    ),
+    'profile': (
+        'id', 'phone_number', 'name', 'email', 'practice_type', 'location', 'about_us',
+        'website_url', 'social_media_links', 'onboarding_step', 'is_active',
+        'subdomain', 'website_published', 'website_status'
+    ),
+}
+
+# Core columns per view, resolved against the mapper once at import - projected reads
+# select exactly these, so rows are built without ORM objects
+_PRACTITIONER_COLUMNS = inspect(Practitioner).columns
+_VIEW_COLUMNS = {
+    view: tuple(_PRACTITIONER_COLUMNS[key] for key in keys) for view, keys in _VIEWS.items()
+}
+
+# Hot single-row statements as lambda_stmt: SQLAlchemy caches each constructed statement on the
+# lambda's code object, so repeat calls skip building and compiling it. Only the binds vary.
+_BASIC_COLUMNS = _VIEW_COLUMNS['basic']
+_FACILITATOR_BY_PHONE_STMT = lambda_stmt(lambda: select(*_BASIC_COLUMNS).where(
+    Practitioner.phone_number == bindparam('phone')
+))
+_CONSUME_OTP_STMT = lambda_stmt(lambda: update(PhoneOTP).where(
+    PhoneOTP.phone_number == bindparam('phone'),
+    PhoneOTP.otp_hash == bindparam('otp_hash'),
+    PhoneOTP.expires_at > func.now(),
+    PhoneOTP.is_verified == False
+).values(is_verified=True).returning(PhoneOTP.id))
+_USER_STATUS_STMT = lambda_stmt(lambda: select(Practitioner.id, Practitioner.onboarding_step).where(
+    Practitioner.phone_number == bindparam('phone')
+))
+
+def _practitioner_row_to_dict(values, view: str) -> Dict[str, Any]:
+    """JSON-ready dict of a practitioner view from its values in view order
+    
+    values is a projected Row of _VIEW_COLUMNS[view] or any iterable in the same order;
+    datetimes become ISO strings.
+    """
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in zip(_VIEWS[view], values)
+    }
+
+# update_facilitator_profile: practitioner columns it may set, and the one-to-one sections
+_PROFILE_MAIN_FIELDS = ('name', 'email')
+_PROFILE_SECTION_MODELS = {
+    'basic_info': FacilitatorBasicInfo,
+    'visual_profile': FacilitatorVisualProfile,
+    'professional_details': FacilitatorProfessionalDetails,
+    'bio_about': FacilitatorBioAbout,
+}
+_SECTION_PROTECTED = frozenset({'id', 'practitioner_id', 'created_at', 'updated_at'})
+
+# Unfiltered searches report pg_class.reltuples instead of COUNT(*) once the table is this big.
+# The estimate is probed at most every few minutes, so small tables pay no extra round trip
+_EXACT_COUNT_LIMIT = 100_000
+_row_estimate_cache = TTLCache(maxsize=1, ttl=300)
+_MISSING = object()
+
 class SecureFacilitatorRepository(SecureRepository):
     """Secure CRUD operations for practitioners/facilitators using ORM"""
     
@@ -36,37 +107,29 @@ class SecureFacilitatorRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Check if practitioner already exists
-                existing = session.query(Practitioner).filter(
-                    Practitioner.phone_number == phone_number
-                ).first()
-                
-                if existing:
+                # Insert-if-absent in one statement: an existing phone number returns no row
+                practitioner_id = session.execute(
+                    pg_insert(Practitioner).values(
+                        phone_number=phone_number,
+                        email=email,
+                        name=name,
+                        is_active=True
+                    ).on_conflict_do_nothing(index_elements=['phone_number']).returning(Practitioner.id)
+                ).scalar_one_or_none()
+                
+                if practitioner_id is None:
                     raise ValueError(f"Practitioner with phone {phone_number} already exists")
                 
-                # Create new practitioner with ORM (automatically secure)
-                practitioner = Practitioner(
-                    phone_number=phone_number,
-                    email=email,
-                    name=name,
-                    is_active=True
-                )
-                
-                session.add(practitioner)
-                session.flush()  # Get ID without committing
-                
-                practitioner_id = practitioner.id
                 logger.info(f"✅ Created practitioner {practitioner_id} for {phone_number}")
-                return practitioner_id
                 
             except IntegrityError as e:
-                session.rollback()
                 logger.error(f"❌ Integrity error creating practitioner: {e}")
                 raise ValueError("Phone number already exists or constraint violation")
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error creating practitioner: {e}")
                 raise
+        
+        return practitioner_id
 
     def get_facilitator_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -80,31 +143,9 @@ class SecureFacilitatorRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.phone_number == phone_number
-                ).first()
+                row = session.execute(_FACILITATOR_BY_PHONE_STMT, {'phone': phone_number}).first()
                 
-                if not practitioner:
-                    return None
-                
-                # Convert to dictionary with relationships
-                return {
-                    'id': practitioner.id,
-                    'phone_number': practitioner.phone_number,
-                    'name': practitioner.name,
-                    'email': practitioner.email,
-                    'practice_type': practitioner.practice_type,
-                    'location': practitioner.location,
-                    'about_us': practitioner.about_us,
-                    'website_url': practitioner.website_url,
-                    'social_media_links': practitioner.social_media_links,
-                    'is_contacted': practitioner.is_contacted,
-                    'contact_status': practitioner.contact_status,
-                    'onboarding_step': practitioner.onboarding_step,
-                    'is_active': practitioner.is_active,
-                    'created_at': practitioner.created_at.isoformat() if practitioner.created_at else None,
-                    'updated_at': practitioner.updated_at.isoformat() if practitioner.updated_at else None
-                }
+                return _practitioner_row_to_dict(row, 'basic') if row else None
                 
             except Exception as e:
                 logger.error(f"❌ Error getting practitioner by phone {phone_number}: {e}")
@@ -122,37 +163,28 @@ class SecureFacilitatorRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Use eager loading to get all related data in one query
+                # One small "WHERE practitioner_id IN (...)" SELECT per relationship instead of
+                # one wide multi-way LEFT OUTER JOIN row carrying every child's JSON columns
                 practitioner = session.query(Practitioner).options(
-                    joinedload(Practitioner.basic_info),
-                    joinedload(Practitioner.visual_profile),
-                    joinedload(Practitioner.professional_details),
-                    joinedload(Practitioner.bio_about),
+                    selectinload(Practitioner.basic_info),
+                    selectinload(Practitioner.visual_profile),
+                    selectinload(Practitioner.professional_details),
+                    selectinload(Practitioner.bio_about),
                     selectinload(Practitioner.work_experience),
                     selectinload(Practitioner.certifications),
-                    joinedload(Practitioner.insights)
+                    selectinload(Practitioner.insights),
+                    # Any relationship the dict builder touches without an eager load raises
+                    raiseload('*')
                 ).filter(Practitioner.id == facilitator_id).first()
                 
                 if not practitioner:
                     return None
                 
                 # Build complete profile dictionary
-                profile = {
-                    'id': practitioner.id,
-                    'phone_number': practitioner.phone_number,
-                    'name': practitioner.name,
-                    'email': practitioner.email,
-                    'practice_type': practitioner.practice_type,
-                    'location': practitioner.location,
-                    'about_us': practitioner.about_us,
-                    'website_url': practitioner.website_url,
-                    'social_media_links': practitioner.social_media_links,
-                    'onboarding_step': practitioner.onboarding_step,
-                    'is_active': practitioner.is_active,
-                    'subdomain': practitioner.subdomain,
-                    'website_published': practitioner.website_published,
-                    'website_status': practitioner.website_status,
-                    
+                # Main columns straight from the loaded state, one dict lookup each
+                state = practitioner.__dict__
+                profile = _practitioner_row_to_dict((state.get(key) for key in _VIEWS['profile']), 'profile')
+                profile.update({
                     # Related data
                     'basic_info': self._serialize_basic_info(practitioner.basic_info),
                     'visual_profile': self._serialize_visual_profile(practitioner.visual_profile),
@@ -161,7 +193,7 @@ class SecureFacilitatorRepository(SecureRepository):
                     'experience': [self._serialize_experience(exp) for exp in practitioner.work_experience],
                     'certifications': [self._serialize_certification(cert) for cert in practitioner.certifications],
                     'insights': self._serialize_insights(practitioner.insights)
-                }
+                })
                 
                 return profile
                 
@@ -179,50 +211,39 @@ class SecureFacilitatorRepository(SecureRepository):
         NEW (SECURE):
         ORM with automatic validation and type checking
         """
+        main_fields = {key: update_data[key] for key in _PROFILE_MAIN_FIELDS if key in update_data}
+        
         with self.db_engine.get_db_session() as session:
             try:
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == facilitator_id
-                ).first()
-                
-                if not practitioner:
+                # Main practitioner fields: one UPDATE that also proves the row exists
+                # (SET id = id when there are none; the trigger stamps updated_at either way)
+                updated_id = session.execute(
+                    update(Practitioner).where(
+                        Practitioner.id == facilitator_id
+                    ).values(main_fields or {'id': Practitioner.id}).returning(Practitioner.id)
+                ).scalar_one_or_none()
+                
+                if updated_id is None:
                     raise ValueError(f"Practitioner {facilitator_id} not found")
                 
-                # Update main practitioner fields (if provided)
-                if 'name' in update_data:
-                    practitioner.name = update_data['name']
-                if 'email' in update_data:
-                    practitioner.email = update_data['email']
-                
-                # Update related tables using ORM relationships
-                if 'basic_info' in update_data:
-                    self._update_basic_info(session, practitioner, update_data['basic_info'])
-                
-                if 'visual_profile' in update_data:
-                    self._update_visual_profile(session, practitioner, update_data['visual_profile'])
-                
-                if 'professional_details' in update_data:
-                    self._update_professional_details(session, practitioner, update_data['professional_details'])
-                
-                if 'bio_about' in update_data:
-                    self._update_bio_about(session, practitioner, update_data['bio_about'])
+                # One-row-per-practitioner sections: one upsert each, no ORM load or attribute diffing
+                for key, model in _PROFILE_SECTION_MODELS.items():
+                    if key in update_data:
+                        self._upsert_section(session, model, facilitator_id, update_data[key])
                 
                 if 'experience' in update_data:
-                    self._update_experience(session, practitioner, update_data['experience'])
+                    self._update_experience(session, facilitator_id, update_data['experience'])
                 
                 if 'certifications' in update_data:
-                    self._update_certifications(session, practitioner, update_data['certifications'])
-                
-                # Update timestamp
-                practitioner.updated_at = datetime.utcnow()
+                    self._update_certifications(session, facilitator_id, update_data['certifications'])
                 
                 logger.info(f"✅ Updated facilitator profile {facilitator_id}")
-                return True
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error updating facilitator profile {facilitator_id}: {e}")
                 raise
+        
+        return True
 
     def create_offering(self, facilitator_id: int, offering_data: Dict[str, Any]) -> int:
         """
@@ -236,12 +257,12 @@ class SecureFacilitatorRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Verify practitioner exists
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.id == facilitator_id
+                # Verify practitioner exists - id only, so the joined one-to-one defaults don't load
+                exists = session.execute(
+                    select(Practitioner.id).where(Practitioner.id == facilitator_id)
                 ).first()
                 
-                if not practitioner:
+                if not exists:
                     raise ValueError(f"Practitioner {facilitator_id} not found")
                 
                 # Create offering with ORM (automatically secure)
@@ -264,7 +285,6 @@ class SecureFacilitatorRepository(SecureRepository):
                 return offering_id
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error creating offering: {e}")
                 raise
 
@@ -280,8 +300,8 @@ class SecureFacilitatorRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Start with base query
-                query = session.query(Practitioner)
+                # Start with base query - only the columns the result rows carry
+                query = session.query(*_VIEW_COLUMNS['search'])
                 
                 # Apply filters using ORM (automatically secure)
                 if filters:
@@ -300,27 +320,34 @@ class SecureFacilitatorRepository(SecureRepository):
                     if 'is_active' in filters:
                         query = query.filter(Practitioner.is_active == filters['is_active'])
                 
-                # Get total count for pagination
-                total_count = query.count()
-                
-                # Apply pagination
                 offset = (page - 1) * limit
-                facilitators = query.offset(offset).limit(limit).all()
-                
-                # Convert to dictionary format
-                results = []
-                for facilitator in facilitators:
-                    results.append({
-                        'id': facilitator.id,
-                        'name': facilitator.name,
-                        'phone_number': facilitator.phone_number,
-                        'email': facilitator.email,
-                        'practice_type': facilitator.practice_type,
-                        'location': facilitator.location,
-                        'is_active': facilitator.is_active,
-                        'onboarding_step': facilitator.onboarding_step,
-                        'created_at': facilitator.created_at.isoformat() if facilitator.created_at else None
-                    })
+                query = query.order_by(Practitioner.id)
+                
+                # Unfiltered search over a large table: the planner's row estimate stands in for
+                # an exact count that would have to scan every row
+                total_count = None
+                if query.whereclause is None:
+                    estimate = _row_estimate_cache.get('practitioners', _MISSING)
+                    if estimate is _MISSING:
+                        estimate = session.execute(text(
+                            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'practitioners'"
+                        )).scalar()
+                        _row_estimate_cache.set('practitioners', estimate)
+                    if estimate is not None and estimate > _EXACT_COUNT_LIMIT:
+                        total_count = estimate
+                
+                if total_count is not None:
+                    rows = query.offset(offset).limit(limit).all()
+                else:
+                    # Page and total in one scan: COUNT(*) OVER () is computed before LIMIT/OFFSET
+                    rows = query.add_columns(func.count().over().label('total_count')).offset(offset).limit(limit).all()
+                    if rows:
+                        total_count = rows[0].total_count
+                    else:
+                        # A page past the end has no rows to carry the total
+                        total_count = query.order_by(None).count() if offset else 0
+                
+                results = [_practitioner_row_to_dict(row, 'search') for row in rows]
                 
                 logger.info(f"✅ Search returned {len(results)} facilitators (page {page})")
                 return results, total_count
@@ -330,23 +357,55 @@ class SecureFacilitatorRepository(SecureRepository):
                 raise
 
     # Helper methods for relationship updates
-    def _update_basic_info(self, session: Session, practitioner: Practitioner, basic_info_data: Dict):
-        """Update basic info using ORM relationship"""
-        if not practitioner.basic_info:
-            basic_info = FacilitatorBasicInfo(practitioner_id=practitioner.id)
-            session.add(basic_info)
-            practitioner.basic_info = basic_info
-        
-        if 'first_name' in basic_info_data:
-            practitioner.basic_info.first_name = basic_info_data['first_name']
-        if 'last_name' in basic_info_data:
-            practitioner.basic_info.last_name = basic_info_data['last_name']
-        if 'location' in basic_info_data:
-            practitioner.basic_info.location = basic_info_data['location']
-        if 'email' in basic_info_data:
-            practitioner.basic_info.email = basic_info_data['email']
-        
-        practitioner.basic_info.updated_at = datetime.utcnow()
+    def _upsert_section(self, session: Session, model, practitioner_id: int, data: Dict[str, Any]):
+        """INSERT ... ON CONFLICT (practitioner_id) DO UPDATE with the section's known columns
+        
+        updated_at is left to the touch_updated_at trigger
+        """
+        values = {
+            key: value for key, value in data.items()
+            if key in model.__table__.columns and key not in _SECTION_PROTECTED
+        }
+        stmt = pg_insert(model).values(practitioner_id=practitioner_id, **values)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['practitioner_id'],
+            set_={key: stmt.excluded[key] for key in values} or {'practitioner_id': practitioner_id}
+        ))
+
+    def _update_experience(self, session: Session, practitioner_id: int, items: List[Dict[str, Any]]):
+        """Make the practitioner's work experience match items (rows with an 'id' are kept/updated)"""
+        self._sync_children(session, FacilitatorWorkExperience, practitioner_id, items)
+
+    def _update_certifications(self, session: Session, practitioner_id: int, items: List[Dict[str, Any]]):
+        """Make the practitioner's certifications match items (rows with an 'id' are kept/updated)"""
+        self._sync_children(session, FacilitatorCertification, practitioner_id, items)
+
+    def _sync_children(self, session: Session, model, practitioner_id: int, items: List[Dict[str, Any]]):
+        """Reconcile a one-to-many child table with three set-based statements
+        
+        One DELETE for rows no longer listed, one executemany UPDATE by primary key for
+        listed ids, one executemany INSERT for new rows - no per-row unit-of-work flush.
+        """
+        def columns(item):
+            return {
+                key: value for key, value in item.items()
+                if key in model.__table__.columns and key not in _SECTION_PROTECTED
+            }
+        
+        to_update = [{'id': item['id'], **columns(item)} for item in items if item.get('id')]
+        to_insert = [{**columns(item), 'practitioner_id': practitioner_id} for item in items if not item.get('id')]
+        keep_ids = [row['id'] for row in to_update]
+        
+        session.execute(
+            delete(model).where(model.practitioner_id == practitioner_id, model.id.notin_(keep_ids)),
+            execution_options={'synchronize_session': False}
+        )
+        if to_update:
+            # The practitioner_id criterion keeps ids from another practitioner untouched;
+            # updated_at is stamped by the column's onupdate=func.now()
+            session.execute(update(model).where(model.practitioner_id == practitioner_id), to_update)
+        if to_insert:
+            session.execute(insert(model), to_insert)
 
     def _serialize_basic_info(self, basic_info: Optional[FacilitatorBasicInfo]) -> Optional[Dict]:
         """Convert basic info to dictionary"""
@@ -456,12 +515,12 @@ class SecureCallingRepository(SecureRepository):
                 
                 transcript_id = transcript.id
                 logger.info(f"✅ Stored call transcript {transcript_id} for {phone_number}")
-                return transcript_id
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error storing call transcript: {e}")
                 raise
+        
+        return transcript_id
 
     def store_call_outcome(self, phone_number: str, outcome: str, approach_used: str = None,
                           duration: int = None, objection_type: str = None, notes: str = None) -> bool:
@@ -492,12 +551,12 @@ class SecureCallingRepository(SecureRepository):
                 self._update_practitioner_insights(session, phone_number, outcome, approach_used, objection_type)
                 
                 logger.info(f"✅ Stored call outcome {outcome} for {phone_number}")
-                return True
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error storing call outcome: {e}")
                 raise
+        
+        return True
 
     def get_practitioner_context(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -511,18 +570,30 @@ class SecureCallingRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Get practitioner with all related data in one secure query
+                # Practitioner plus insights in one query; no other relationship may lazy-load
                 practitioner = session.query(Practitioner).options(
                     joinedload(Practitioner.insights),
-                    selectinload(Practitioner.call_transcripts).options(
-                        joinedload(CallTranscript.practitioner)
-                    ),
-                    selectinload(Practitioner.call_outcomes)
+                    raiseload('*')
                 ).filter(Practitioner.phone_number == phone_number).first()
                 
                 if not practitioner:
                     return None
                 
+                # Only the 5 most recent calls/outcomes leave the database, oldest first as before
+                recent_transcripts = session.query(
+                    CallTranscript.created_at, CallTranscript.call_duration_seconds,
+                    CallTranscript.call_status, CallTranscript.conversation_summary
+                ).filter(
+                    CallTranscript.phone_number == phone_number
+                ).order_by(CallTranscript.created_at.desc()).limit(5).all()[::-1]
+                
+                recent_outcomes = session.query(
+                    CallOutcome.call_outcome, CallOutcome.approach_used,
+                    CallOutcome.objection_type, CallOutcome.call_date
+                ).filter(
+                    CallOutcome.phone_number == phone_number
+                ).order_by(CallOutcome.call_date.desc()).limit(5).all()[::-1]
+                
                 # Build context using ORM relationships
                 context = {
                     'practitioner': {
@@ -535,23 +606,14 @@ class SecureCallingRepository(SecureRepository):
                         'contact_status': practitioner.contact_status
                     },
                     'insights': self._serialize_insights(practitioner.insights),
+                    # Rows are plain tuples in projection order - unpack instead of attribute lookups
                     'call_history': [
-                        {
-                            'date': transcript.created_at.isoformat(),
-                            'duration': transcript.call_duration_seconds,
-                            'status': transcript.call_status,
-                            'summary': transcript.conversation_summary
-                        }
-                        for transcript in practitioner.call_transcripts[-5:]  # Last 5 calls
+                        {'date': date.isoformat(), 'duration': duration, 'status': status, 'summary': summary}
+                        for date, duration, status, summary in recent_transcripts
                     ],
                     'call_outcomes': [
-                        {
-                            'outcome': outcome.call_outcome,
-                            'approach': outcome.approach_used,
-                            'objection': outcome.objection_type,
-                            'date': outcome.call_date.isoformat()
-                        }
-                        for outcome in practitioner.call_outcomes[-5:]  # Last 5 outcomes
+                        {'outcome': result, 'approach': approach, 'objection': objection, 'date': date.isoformat()}
+                        for result, approach, objection, date in recent_outcomes
                     ]
                 }
                 
@@ -564,58 +626,58 @@ class SecureCallingRepository(SecureRepository):
     def _extract_conversation_summary(self, transcript_data: Dict) -> str:
         """Extract human-readable summary from transcript JSON"""
         try:
-            items = transcript_data.get("transcript", {}).get("items", [])
-            summary_parts = []
-            
-            for item in items:
-                if item.get("type") == "message":
-                    role = "AI" if item.get("role") == "assistant" else "User"
-                    content = " ".join(item.get("content", []))
-                    summary_parts.append(f"{role}: {content}")
-            
-            return "\n".join(summary_parts)
+            items = transcript_data.get("transcript", {}).get("items", ())
+            # One join over a generator - no intermediate list of message lines
+            return "\n".join(
+                f"{'AI' if item.get('role') == 'assistant' else 'User'}: {' '.join(item.get('content', ()))}"
+                for item in items
+                if item.get("type") == "message"
+            )
         except Exception:
             return "Summary extraction failed"
 
     def _update_practitioner_insights(self, session: Session, phone_number: str, 
                                     outcome: str, approach_used: str, objection_type: str):
-        """Update practitioner insights based on call outcome"""
-        # Get or create insights record
-        insights = session.query(PractitionerInsight).filter(
-            PractitionerInsight.phone_number == phone_number
-        ).first()
+        """Update practitioner insights based on call outcome
         
-        if not insights:
-            insights = PractitionerInsight(phone_number=phone_number)
-            session.add(insights)
-        
-        # Update call statistics
-        insights.total_calls = (insights.total_calls or 0) + 1
+        One INSERT ... ON CONFLICT DO UPDATE: counters and approach arrays are changed by the
+        database against the current row, so concurrent outcomes for the same phone cannot
+        overwrite each other and no read-modify-write round trip is needed.
+        """
+        success = 1 if outcome == 'success' else 0
+        approaches_column = 'successful_approaches' if success else 'failed_approaches'
         
-        if outcome == 'success':
-            insights.successful_calls = (insights.successful_calls or 0) + 1
+        stmt = pg_insert(PractitionerInsight).values(
+            phone_number=phone_number,
+            total_calls=1,
+            successful_calls=success,
+            conversion_probability=float(success),
+            primary_objection=objection_type or None,
+            last_updated=func.now(),
+            **({approaches_column: [approach_used]} if approach_used else {})
+        )
         
-        # Update conversion probability
-        if insights.total_calls > 0:
-            insights.conversion_probability = insights.successful_calls / insights.total_calls
+        # Update call statistics and conversion probability from the stored counters
+        total_calls = func.coalesce(PractitionerInsight.total_calls, 0) + 1
+        successful_calls = func.coalesce(PractitionerInsight.successful_calls, 0) + success
+        set_ = {
+            'total_calls': total_calls,
+            'successful_calls': successful_calls,
+            'conversion_probability': cast(successful_calls, Float) / total_calls,
+            # First recorded objection wins
+            'primary_objection': func.coalesce(PractitionerInsight.primary_objection, stmt.excluded.primary_objection),
+            'last_updated': func.now(),
+        }
         
-        # Update approaches and objections
+        # Append the approach unless already present (array_append on NULL starts a new array)
         if approach_used:
-            if outcome == 'success':
-                if not insights.successful_approaches:
-                    insights.successful_approaches = []
-                if approach_used not in insights.successful_approaches:
-                    insights.successful_approaches.append(approach_used)
-            else:
-                if not insights.failed_approaches:
-                    insights.failed_approaches = []
-                if approach_used not in insights.failed_approaches:
-                    insights.failed_approaches.append(approach_used)
-        
-        if objection_type and not insights.primary_objection:
-            insights.primary_objection = objection_type
-        
-        insights.last_updated = datetime.utcnow()
+            approaches = getattr(PractitionerInsight, approaches_column)
+            set_[approaches_column] = case(
+                (approaches.any(approach_used), approaches),
+                else_=func.array_append(approaches, approach_used)
+            )
+        
+        session.execute(stmt.on_conflict_do_update(index_elements=['phone_number'], set_=set_))
 
 class SecureOTPRepository(SecureRepository):
     """Secure OTP operations using ORM"""
@@ -632,26 +694,24 @@ class SecureOTPRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Clean up expired OTPs first
-                self._cleanup_expired_otps(session, phone_number)
-                
-                # Create new OTP with ORM
-                expires_at = datetime.utcnow() + timedelta(minutes=expires_in_minutes)
-                
-                otp_record = PhoneOTP(
+                # Replace any pending OTP in place - at most one per phone (ux_phone_otps_phone_pending).
+                # Expiry is computed from the database clock, the same clock verify_otp compares against
+                stmt = pg_insert(PhoneOTP).values(
                     phone_number=phone_number,
-                    otp=otp,
-                    expires_at=expires_at,
+                    otp_hash=hash_otp(otp),
+                    expires_at=func.now() + timedelta(minutes=expires_in_minutes),
                     is_verified=False
                 )
-                
-                session.add(otp_record)
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['phone_number'],
+                    index_where=PhoneOTP.is_verified == False,
+                    set_={'otp': None, 'otp_hash': stmt.excluded.otp_hash, 'expires_at': stmt.excluded.expires_at, 'created_at': func.now()}
+                ))
                 
                 logger.info(f"✅ Created OTP for {phone_number}")
                 return True
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error creating OTP: {e}")
                 raise
 
@@ -667,26 +727,16 @@ class SecureOTPRepository(SecureRepository):
         """
         with self.db_engine.get_db_session() as session:
             try:
-                # Find valid OTP using ORM (automatically secure)
-                otp_record = session.query(PhoneOTP).filter(
-                    and_(
-                        PhoneOTP.phone_number == phone_number,
-                        PhoneOTP.otp == otp,
-                        PhoneOTP.expires_at > datetime.utcnow(),
-                        PhoneOTP.is_verified == False
-                    )
-                ).first()
+                # Check and consume in one atomic statement - a code can be used only once
+                otp_id = session.execute(
+                    _CONSUME_OTP_STMT, {'phone': phone_number, 'otp_hash': hash_otp(otp)}
+                ).scalar_one_or_none()
                 
-                if not otp_record:
+                if otp_id is None:
                     return False, None
                 
-                # Mark as verified
-                otp_record.is_verified = True
-                
                 # Get practitioner status
-                practitioner = session.query(Practitioner).filter(
-                    Practitioner.phone_number == phone_number
-                ).first()
+                practitioner = session.execute(_USER_STATUS_STMT, {'phone': phone_number}).first()
                 
                 user_status = {
                     'is_new_user': practitioner is None,
@@ -699,15 +749,24 @@ class SecureOTPRepository(SecureRepository):
                 return True, user_status
                 
             except Exception as e:
-                session.rollback()
                 logger.error(f"❌ Error verifying OTP: {e}")
                 raise
 
-    def _cleanup_expired_otps(self, session: Session, phone_number: str):
-        """Clean up expired OTPs for phone number"""
-        session.query(PhoneOTP).filter(
-            and_(
-                PhoneOTP.phone_number == phone_number,
-                PhoneOTP.expires_at <= datetime.utcnow()
-            )
-        ).delete() 
\ No newline at end of file
+    def purge_expired_otps(self, grace: timedelta = timedelta(days=1), batch_size: int = 10_000) -> int:
+        """Delete OTPs that expired more than grace ago; returns the number removed
+        
+        Expired rows are no longer deleted inline on the OTP paths - run this on a schedule
+        (purge_expired_otps.py). Each batch commits on its own, so row locks stay short.
+        """
+        expired_ids = select(PhoneOTP.id).where(
+            PhoneOTP.expires_at <= func.now() - bindparam('grace')
+        ).limit(bindparam('batch_size')).scalar_subquery()
+        stmt = delete(PhoneOTP).where(PhoneOTP.id.in_(expired_ids))
+        
+        total = 0
+        while True:
+            with self.db_engine.get_db_session() as session:
+                deleted = session.execute(stmt, {'grace': grace, 'batch_size': batch_size}).rowcount
+            total += deleted
+            if deleted < batch_size:
+                return total 
\ No newline at end of file
@@ -3,14 +3,19 @@ SQLAlchemy ORM Models for Ahoum CRM System
 Replaces raw SQL with secure ORM patterns
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, Float, ARRAY, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, LargeBinary, ARRAY, JSON, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import sessionmaker, relationship, Session
 from sqlalchemy.sql import func
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 import os
 
+from .engine import get_engine, guard_lazy_loads
+
 Base = declarative_base()
 
 # =============================================================================
@@ -61,16 +66,17 @@ class Practitioner(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
-    # Relationships
+    # Relationships - one-to-ones are read with their practitioner almost every time, so they
+    # default to a LEFT OUTER JOIN (at most one row each, no duplication); collections stay lazy
     call_transcripts = relationship("CallTranscript", back_populates="practitioner", cascade="all, delete-orphan")
     call_outcomes = relationship("CallOutcome", back_populates="practitioner", cascade="all, delete-orphan")
-    insights = relationship("PractitionerInsight", back_populates="practitioner", uselist=False, cascade="all, delete-orphan")
-    basic_info = relationship("FacilitatorBasicInfo", back_populates="practitioner", uselist=False, cascade="all, delete-orphan")
-    visual_profile = relationship("FacilitatorVisualProfile", back_populates="practitioner", uselist=False, cascade="all, delete-orphan")
-    professional_details = relationship("FacilitatorProfessionalDetails", back_populates="practitioner", uselist=False, cascade="all, delete-orphan")
-    bio_about = relationship("FacilitatorBioAbout", back_populates="practitioner", uselist=False, cascade="all, delete-orphan")
+    insights = relationship("PractitionerInsight", back_populates="practitioner", uselist=False, cascade="all, delete-orphan", lazy='joined')
+    basic_info = relationship("FacilitatorBasicInfo", back_populates="practitioner", uselist=False, cascade="all, delete-orphan", lazy='joined')
+    visual_profile = relationship("FacilitatorVisualProfile", back_populates="practitioner", uselist=False, cascade="all, delete-orphan", lazy='joined')
+    professional_details = relationship("FacilitatorProfessionalDetails", back_populates="practitioner", uselist=False, cascade="all, delete-orphan", lazy='joined')
+    bio_about = relationship("FacilitatorBioAbout", back_populates="practitioner", uselist=False, cascade="all, delete-orphan", lazy='joined')
     work_experience = relationship("FacilitatorWorkExperience", back_populates="practitioner", cascade="all, delete-orphan")
     certifications = relationship("FacilitatorCertification", back_populates="practitioner", cascade="all, delete-orphan")
     offerings = relationship("Offering", back_populates="practitioner", cascade="all, delete-orphan")
@@ -156,7 +162,7 @@ class FacilitatorBasicInfo(Base):
     location = Column(String(255))
     email = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="basic_info")
@@ -167,10 +173,10 @@ class FacilitatorVisualProfile(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False, index=True)
-    banner_urls = Column(ARRAY(String))
+    banner_urls = Column(JSONB)
     profile_url = Column(String(500))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="visual_profile")
@@ -181,11 +187,11 @@ class FacilitatorProfessionalDetails(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), unique=True, nullable=False, index=True)
-    languages = Column(ARRAY(String))
-    teaching_styles = Column(ARRAY(String))
-    specializations = Column(ARRAY(String))
+    languages = Column(JSONB)
+    teaching_styles = Column(JSONB)
+    specializations = Column(JSONB)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="professional_details")
@@ -199,7 +205,7 @@ class FacilitatorBioAbout(Base):
     short_bio = Column(Text)
     detailed_intro = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="bio_about")
@@ -215,7 +221,7 @@ class FacilitatorWorkExperience(Base):
     duration = Column(String(100))
     description = Column(Text)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="work_experience")
@@ -231,7 +237,7 @@ class FacilitatorCertification(Base):
     date_received = Column(DateTime)
     credential_id = Column(String(255))
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="certifications")
@@ -243,10 +249,12 @@ class FacilitatorCertification(Base):
 class PhoneOTP(Base):
     """Manage OTP-based phone authentication"""
     __tablename__ = 'phone_otps'
+    # Indexes are declared on models.database.PhoneOTP and built by the migrations
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False, index=True)
-    otp = Column(String(10), nullable=False)
+    phone_number = Column(String(20), ForeignKey('practitioners.phone_number'), nullable=False)
+    otp = Column(String(10))  # legacy plaintext, cleared by migrations/add_phone_otps_hash.py
+    otp_hash = Column(LargeBinary)  # HMAC-SHA256 of the OTP (models/otp.py)
     otp_type = Column(String(50), default='verification')
     expires_at = Column(DateTime, nullable=False, index=True)
     is_verified = Column(Boolean, default=False)
@@ -262,18 +270,19 @@ class PhoneOTP(Base):
 class Offering(Base):
     """Store courses/services offered by practitioners"""
     __tablename__ = 'offerings'
+    # Indexes are declared on models.database.Offering and built by the migrations
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     category = Column(String(100), index=True)
-    basic_info = Column(JSON)
-    details = Column(JSON)
-    price_schedule = Column(JSON)
+    basic_info = Column(JSONB)
+    details = Column(JSONB)
+    price_schedule = Column(JSONB)
     is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="offerings")
@@ -281,6 +290,7 @@ class Offering(Base):
 class Course(Base):
     """Specific courses for promotional calling campaigns"""
     __tablename__ = 'courses'
+    # Indexes are declared on models.database.Course and built by the migrations
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     practitioner_id = Column(Integer, ForeignKey('practitioners.id'), nullable=False, index=True)
@@ -290,7 +300,7 @@ class Course(Base):
     description = Column(Text, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner", back_populates="courses")
@@ -312,7 +322,7 @@ class CoursePromotionCall(Base):
     follow_up_required = Column(Boolean, default=False)
     scheduled_callback = Column(DateTime)
     created_at = Column(DateTime, default=func.current_timestamp())
-    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    updated_at = Column(DateTime, default=func.current_timestamp())  # maintained by the touch_updated_at trigger
     
     # Relationships
     practitioner = relationship("Practitioner")
@@ -322,23 +332,20 @@ class CoursePromotionCall(Base):
 # DATABASE ENGINE AND SESSION MANAGEMENT
 # =============================================================================
 
+# (engine, session) of the outermost get_db_session block active in this thread/task
+_active_session: ContextVar[Optional[Tuple[Any, Session]]] = ContextVar('active_db_session', default=None)
+
 class DatabaseEngine:
     """Secure SQLAlchemy engine with connection pooling"""
     
-    def __init__(self, database_url: str):
-        self.engine = create_engine(
-            database_url,
-            # Security settings
-            pool_pre_ping=True,  # Validate connections before use
-            pool_recycle=3600,   # Recycle connections every hour
-            pool_size=10,        # Connection pool size
-            max_overflow=20,     # Maximum overflow connections
-            echo=False,          # Set to True for SQL debugging
-            # Security: Prevent SQL injection through engine
-            module=None,
-            future=True
-        )
+    def __init__(self, database_url: str, raise_on_lazy: Optional[bool] = None):
+        """raise_on_lazy (default: the ORM_RAISE_ON_LAZY env var) turns on the lazy-load
+        guard for this engine's sessions - see models.engine.guard_lazy_loads
+        """
+        # Shared per-URL pool (models/engine.py), sized from Config
+        self.engine = get_engine(database_url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        guard_lazy_loads(self.SessionLocal, raise_on_lazy)
     
     def create_tables(self):
         """Create all tables (only if they don't exist)"""
@@ -348,9 +355,27 @@ class DatabaseEngine:
         """Get database session with automatic cleanup"""
         return self.SessionLocal()
     
-    def get_db_session(self):
-        """Context manager for database sessions"""
+    @contextmanager
+    def get_db_session(self) -> Iterator[Session]:
+        """Context manager for database sessions
+        
+        Blocks nested inside an active block on the same engine (in the same thread or
+        asyncio task) reuse its session, so several repository calls wrapped in one outer
+        `with db_engine.get_db_session():` share a single connection and one BEGIN/COMMIT.
+        Only the outermost block commits and closes. A nested block runs in a SAVEPOINT:
+        if it raises, only its own writes are undone and the outer block can carry on.
+        Callers must not call session.rollback() themselves - that would discard the
+        outer block's work too; raising is enough.
+        """
+        active = _active_session.get()
+        if active is not None and active[0] is self.engine:
+            session = active[1]
+            with session.begin_nested():
+                yield session
+            return
+        
         session = self.get_session()
+        token = _active_session.set((self.engine, session))
         try:
             yield session
             session.commit()
@@ -358,6 +383,7 @@ class DatabaseEngine:
             session.rollback()
             raise
         finally:
+            _active_session.reset(token)
             session.close()
 
 # =============================================================================
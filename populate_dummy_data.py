@@ -1,83 +1,95 @@
-import os
-import json
-from models.database import DatabaseManager
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models.database import DatabaseManager, Practitioner, Offering, PhoneOTP
+from models.otp import hash_otp
+
+# Rows per INSERT statement - each batch is one round trip
+BATCH_SIZE = 1000
 
 # Initialize DatabaseManager
 db_manager = DatabaseManager()
 
-def clear_existing_data():
-    """Clear all existing data from the database."""
-    try:
-        db_manager.cursor.execute("TRUNCATE TABLE phone_otps, offerings, facilitators RESTART IDENTITY CASCADE;")
-        db_manager.connection.commit()
-        print("All existing data cleared.")
-    except Exception as e:
-        print(f"Error clearing data: {e}")
+def _batches(rows, size=BATCH_SIZE):
+    """Yield consecutive slices of rows"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def _insert_rows(session, stmt, rows, returning=False):
+    """Insert rows in batches; executemany is sent as multi-row VALUES by the engine"""
+    returned = []
+    for batch in _batches(rows):
+        result = session.execute(stmt, batch)
+        if returning:
+            returned.extend(result.all())
+    return returned
 
 def insert_dummy_data():
-    """Insert one manually defined dummy row into each table."""
+    """Insert manually defined dummy rows into each table.
+    
+    Idempotent: rows whose phone number is already present are skipped, existing data is never touched.
+    """
     try:
-        # Insert into facilitators
-        db_manager.cursor.execute(
-            """
-            INSERT INTO facilitators (phone_number, email, name, basic_info, professional_details, bio_about, experience, certifications, visual_profile)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
-            """,
-            (
-                "+1234567890",  # phone_number
-                "dummy.email@example.com",  # email
-                "John Doe",  # name
-                json.dumps({"age": 30, "location": "New York"}),  # basic_info
-                json.dumps({"profession": "Engineer", "company": "TechCorp"}),  # professional_details
-                json.dumps({"bio": "Experienced professional with a passion for teaching."}),  # bio_about
-                json.dumps({"years": 10}),  # experience
-                json.dumps({"certifications": ["Certified Trainer", "Project Manager"]}),  # certifications
-                json.dumps({"profile_picture": "http://example.com/profile.jpg"})  # visual_profile
-            )
-        )
-
-        # Insert into offerings
-        db_manager.cursor.execute(
-            """
-            INSERT INTO offerings (facilitator_id, title, description, category, basic_info, details, price_schedule)
-            VALUES (%s, %s, %s, %s, %s, %s, %s);
-            """,
-            (
-                1,  # facilitator_id
-                "Introduction to Python",  # title
-                "A comprehensive beginner's course on Python programming.",  # description
-                "Programming",  # category
-                json.dumps({"duration": "5 hours"}),  # basic_info
-                json.dumps({"details": "This course covers the basics of Python, including syntax, data types, and functions."}),  # details
-                json.dumps({"price": 500})  # price_schedule
-            )
-        )
+        now = datetime.now()
+        practitioners = [
+            {
+                "phone_number": "+1234567890",
+                "email": "dummy.email@example.com",
+                "name": "John Doe",
+                "practice_type": "Engineer",
+                "location": "New York",
+                "about_us": "Experienced professional with a passion for teaching.",
+            },
+        ]
+        offerings_by_phone = {
+            "+1234567890": [
+                {
+                    "title": "Introduction to Python",
+                    "description": "A comprehensive beginner's course on Python programming.",
+                    "category": "Programming",
+                    "basic_info": {"duration": "5 hours"},
+                    "details": {"details": "This course covers the basics of Python, including syntax, data types, and functions."},
+                    "price_schedule": {"price": 500},
+                },
+            ],
+        }
+        otps = [
+            {
+                "phone_number": "+1234567890",
+                "otp_hash": hash_otp("123456"),
+                "created_at": now,
+                "expires_at": now + timedelta(minutes=5),
+            },
+        ]
 
-        # Insert into phone_otps
-        db_manager.cursor.execute(
-            """
-            INSERT INTO phone_otps (phone_number, otp, created_at, expires_at)
-            VALUES (%s, %s, %s, %s);
-            """,
-            (
-                "+1234567890",  # phone_number
-                "123456",  # otp
-                "2025-06-21 10:00:00",  # created_at
-                "2025-06-21 10:05:00"  # expires_at
+        with db_manager.get_session() as session, session.begin():
+            # Only newly inserted practitioners come back (ON CONFLICT DO NOTHING), so offerings
+            # are seeded once per dummy practitioner
+            ids = _insert_rows(
+                session,
+                pg_insert(Practitioner).on_conflict_do_nothing(index_elements=['phone_number'])
+                .returning(Practitioner.id, Practitioner.phone_number, sort_by_parameter_order=True),
+                practitioners,
+                returning=True
             )
-        )
+            offerings = [
+                {**offering, "practitioner_id": practitioner_id}
+                for practitioner_id, phone_number in ids
+                for offering in offerings_by_phone.get(phone_number, [])
+            ]
+            _insert_rows(session, pg_insert(Offering), offerings)
+            # At most one pending OTP per phone (ux_phone_otps_phone_pending)
+            _insert_rows(session, pg_insert(PhoneOTP).on_conflict_do_nothing(
+                index_elements=['phone_number'], index_where=PhoneOTP.is_verified == False
+            ), otps)
 
-        db_manager.connection.commit()
         print("Dummy data inserted successfully.")
     except Exception as e:
         print(f"Error inserting dummy data: {e}")
 
 def main():
-    # Drop and recreate tables to ensure schema is correct
-    db_manager.cursor.execute("DROP TABLE IF EXISTS phone_otps, offerings, facilitators CASCADE;")
-    db_manager._setup_tables()
+    # Create any missing tables, then add the dummy rows that aren't there yet
+    db_manager.db_session.create_tables()
 
-    clear_existing_data()
     insert_dummy_data()
     db_manager.close_connection()
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Expired OTP Sweeper
+Deletes phone_otps rows that expired more than a day ago, in batches of 10k.
+OTP send/verify no longer clean up inline, so schedule this, e.g. every 5 minutes:
+
+    */5 * * * * cd /app && python purge_expired_otps.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add the current directory to Python path
+sys.path.append(str(Path(__file__).parent))
+
+from models.sqlalchemy_models import db_engine
+from models.secure_repositories import SecureOTPRepository
+
+def purge_expired_otps() -> bool:
+    """Run one sweep"""
+    try:
+        removed = SecureOTPRepository(db_engine).purge_expired_otps()
+        print(f"✅ Purged {removed} expired OTPs")
+        return True
+    except Exception as e:
+        print(f"❌ OTP purge failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if purge_expired_otps() else 1)
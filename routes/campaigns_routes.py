@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from models.database import DatabaseManager, CampaignRepository, StudentRepository
 from middleware.auth_required import token_required
 import logging
+import json
 import requests
 from config import Config
 
@@ -38,6 +39,37 @@ def get_campaigns():
             "message": "Failed to fetch campaigns"
         }), 500
 
+@campaigns_bp.route('/stream', methods=['GET'])
+@token_required
+def stream_campaigns():
+    """Stream all campaigns for the current practitioner as NDJSON (one campaign per line)"""
+    practitioner_id = request.facilitator_id
+    
+    # Fetch the first row up front: an error here still gets a JSON 500 instead of a truncated 200
+    try:
+        rows = campaign_repo.iter_campaigns(practitioner_id)
+        first = next(rows, None)
+    except Exception as e:
+        logger.error(f"Error streaming campaigns: {e}")
+        return jsonify({
+            "error": "Server error",
+            "message": "Failed to stream campaigns"
+        }), 500
+    
+    def generate():
+        try:
+            if first is not None:
+                yield json.dumps(first, default=str) + "\n"
+            for campaign in rows:
+                yield json.dumps(campaign, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent - the body just ends early, so leave a trace
+            logger.error(f"Error streaming campaigns after the first row: {e}")
+        finally:
+            rows.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @campaigns_bp.route('/', methods=['POST'])
 @token_required
 def create_campaign():
@@ -87,12 +119,25 @@ def create_campaign():
 def get_campaign_targets(campaign_id):
     """Get target students for a campaign"""
     try:
-        targets = campaign_repo.get_campaign_targets(campaign_id)
+        practitioner_id = request.facilitator_id
+        # LIMIT/OFFSET reject negatives - clamp instead of letting the query fail
+        limit = max(min(request.args.get('limit', 200, type=int), 1000), 0)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        
+        targets = campaign_repo.get_campaign_targets(campaign_id, practitioner_id, limit=limit, offset=offset)
+        
+        if targets is None:
+            return jsonify({
+                "error": "Campaign not found",
+                "message": "Campaign not found or access denied"
+            }), 404
         
         return jsonify({
             "success": True,
             "targets": targets,
-            "count": len(targets)
+            "count": len(targets),
+            "limit": limit,
+            "offset": offset
         }), 200
         
     except Exception as e:
@@ -109,10 +154,16 @@ def launch_campaign(campaign_id):
     try:
         practitioner_id = request.facilitator_id
         
-        # Get campaign targets
-        targets = campaign_repo.get_campaign_targets(campaign_id)
+        # Count every campaign target - launches are not paginated
+        targets_count = campaign_repo.count_campaign_targets(campaign_id, practitioner_id)
+        
+        if targets_count is None:
+            return jsonify({
+                "error": "Campaign not found",
+                "message": "Campaign not found or access denied"
+            }), 404
         
-        if not targets:
+        if not targets_count:
             return jsonify({
                 "error": "No targets found",
                 "message": "No students match the campaign criteria"
@@ -124,7 +175,7 @@ def launch_campaign(campaign_id):
         return jsonify({
             "success": True,
             "message": "Campaign launched successfully",
-            "targets_count": len(targets),
+            "targets_count": targets_count,
             "note": "Automated calling integration available"
         }), 200
         
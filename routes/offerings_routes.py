@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from models.database import DatabaseManager, FacilitatorRepository
 from middleware.auth_required import token_required
 import logging
+import json
 
 # Create blueprint
 offerings_bp = Blueprint('offerings', __name__)
@@ -58,6 +59,37 @@ def list_offerings():
             "message": "Failed to list offerings"
         }), 500
 
+@offerings_bp.route('/stream', methods=['GET'])
+@token_required
+def stream_offerings():
+    """Stream all active offerings for the current facilitator as NDJSON (one offering per line)"""
+    facilitator_id = request.facilitator_id
+    
+    # Fetch the first row up front: an error here still gets a JSON 500 instead of a truncated 200
+    try:
+        rows = facilitator_repo.iter_facilitator_offerings(facilitator_id)
+        first = next(rows, None)
+    except Exception as e:
+        logger.error(f"Error streaming offerings: {e}")
+        return jsonify({
+            "error": "Server error",
+            "message": "Failed to stream offerings"
+        }), 500
+    
+    def generate():
+        try:
+            if first is not None:
+                yield json.dumps(first, default=str) + "\n"
+            for offering in rows:
+                yield json.dumps(offering, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent - the body just ends early, so leave a trace
+            logger.error(f"Error streaming offerings after the first row: {e}")
+        finally:
+            rows.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @offerings_bp.route('/', methods=['POST'])
 @token_required
 def create_new_offering():
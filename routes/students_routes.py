@@ -1,9 +1,10 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from models.database import DatabaseManager, StudentRepository
 from middleware.auth_required import token_required
 import csv
 import io
 import logging
+import json
 
 # Create blueprint
 students_bp = Blueprint('students', __name__)
@@ -49,6 +50,37 @@ def get_students():
             "message": "Failed to fetch students"
         }), 500
 
+@students_bp.route('/stream', methods=['GET'])
+@token_required
+def stream_students():
+    """Stream all students for the current practitioner as NDJSON (one student per line)"""
+    practitioner_id = request.facilitator_id
+    
+    # Fetch the first row up front: an error here still gets a JSON 500 instead of a truncated 200
+    try:
+        rows = student_repo.iter_students(practitioner_id)
+        first = next(rows, None)
+    except Exception as e:
+        logger.error(f"Error streaming students: {e}")
+        return jsonify({
+            "error": "Server error",
+            "message": "Failed to stream students"
+        }), 500
+    
+    def generate():
+        try:
+            if first is not None:
+                yield json.dumps(first, default=str) + "\n"
+            for student in rows:
+                yield json.dumps(student, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent - the body just ends early, so leave a trace
+            logger.error(f"Error streaming students after the first row: {e}")
+        finally:
+            rows.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @students_bp.route('/', methods=['POST'])
 @token_required
 def create_student():